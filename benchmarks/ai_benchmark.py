@@ -0,0 +1,170 @@
+"""
+Benchmark the AI stage (match check, budget analysis, bid generation)
+against the local mock LLM server.
+
+    python -m benchmarks.ai_benchmark --projects 300 --workers 8 --llm-latency-ms 400 --llm-jitter-ms 150
+    python -m benchmarks.ai_benchmark --projects 300 --workers 8 --batch-size 8 --llm-latency-ms 400
+
+Reports projects/minute and per-call latency percentiles for AIService.
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.freelancer_stub import FIXTURES_FILE, load_templates
+from benchmarks.mock_llm_server import add_mock_llm_arguments, mock_llm_state_from_args, start_mock_llm_server
+from benchmarks.run_benchmark import percentile
+
+def build_projects(templates: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    """
+    Build filtered-project dicts, as FreelancerService.filter_projects returns them.
+    """
+    projects = []
+    for index in range(count):
+        template = templates[index % len(templates)]
+        currency = template.get('currency', {'code': 'USD', 'exchange_rate': 1})
+        budget = template.get('budget', {'minimum': 30, 'maximum': 250})
+        projects.append({
+            'id': 100000 + index,
+            'owner_id': 500000 + index,
+            'project_title': template['title'],
+            'project_description': template['description'],
+            'minimum_budget': budget['minimum'],
+            'maximum_budget': budget['maximum'],
+            'currency': currency['code'],
+            'type': template.get('type', 'fixed'),
+            'exchange_rate': currency.get('exchange_rate', 1),
+            'submitdate': int(time.time()),
+            'seo_url': f"stub-project-{100000 + index}"
+        })
+    return projects
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Benchmark AIService against a local mock LLM server')
+    parser.add_argument('--projects', type=int, default=100, help='Projects to run through the AI stage')
+    parser.add_argument('--workers', type=int, default=1, help='Projects evaluated concurrently')
+    parser.add_argument('--fixtures', type=Path, default=FIXTURES_FILE, help='Project templates JSON file')
+    parser.add_argument('--combined', action='store_true', help='Use the single-call combined analysis mode')
+    parser.add_argument('--cache', action='store_true', help='Use the persistent LLM cache (fixture reposts hit it)')
+    parser.add_argument('--api-keys', type=int, default=1, help='Groq keys in the provider pool (each has its own TPM quota)')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='Projects per batched match check call, 1 for one call per project')
+    parser.add_argument('--no-generation-profiles', action='store_true',
+                        help='Send no reasoning setting or token caps, for comparison with the default profiles')
+    add_mock_llm_arguments(parser)
+    return parser
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    state = mock_llm_state_from_args(args)
+    server = start_mock_llm_server(state)
+    os.environ['GROQ_API_BASE'] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault('GROQ_API_KEY', 'benchmark-key')
+    os.environ['GROQ_API_KEYS'] = ','.join(f"benchmark-key-{index}" for index in range(2, args.api_keys + 1))
+    os.environ['DATABASE_URL'] = f"sqlite:///{Path(tempfile.mkdtemp(prefix='ai_bench_')) / 'benchmark.db'}"
+
+    from src.ai_service import AIService
+    from src.database import DatabaseService
+    from src.llm_cache import LLMCache
+
+    ai_service = AIService(llm_cache=LLMCache(DatabaseService()) if args.cache else None)
+    ai_service.combined_analysis = args.combined
+    if args.no_generation_profiles:
+        ai_service.reasoning_effort = ''
+    timings: Dict[str, List[float]] = {'combined': [], 'match': [], 'budget': [], 'bid': []}
+
+    def timed(stage: str, call, project: Dict[str, Any]) -> str:
+        started = time.perf_counter()
+        result = call(project)
+        timings[stage].append(time.perf_counter() - started)
+        return result
+
+    def evaluate(project: Dict[str, Any], verdict: str = None) -> str:
+        if ai_service.combined_analysis:
+            analysis = timed('combined', ai_service.analyze_project, project)
+            if analysis is not None:
+                return analysis['verdict']
+
+        if verdict is None:
+            verdict = timed('match', ai_service.check_project_match, project)
+        if verdict.lower() == 'match':
+            timed('bid', ai_service.generate_bid_content, project)
+            timed('budget', ai_service.analyze_budget_deadline, project)
+        return verdict
+
+    def evaluate_batch(batch: List[Dict[str, Any]]) -> List[str]:
+        # One call for the batch; each project is charged the whole call, as its verdict waits for it
+        started = time.perf_counter()
+        verdicts = ai_service.check_projects_match(batch)
+        timings['match'].extend([time.perf_counter() - started] * len(batch))
+        return [
+            evaluate(project, verdict or timed('match', ai_service.check_project_match, project))
+            for project, verdict in zip(batch, verdicts)
+        ]
+
+    projects = build_projects(load_templates(args.fixtures), args.projects)
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        if args.batch_size > 1 and not args.combined:
+            batches = [projects[index:index + args.batch_size] for index in range(0, len(projects), args.batch_size)]
+            results = [verdict for verdicts in executor.map(evaluate_batch, batches) for verdict in verdicts]
+        else:
+            results = list(executor.map(evaluate, projects))
+    elapsed = time.perf_counter() - started_at
+    server.shutdown()
+
+    return {
+        'elapsed_seconds': round(elapsed, 2),
+        'projects': len(projects),
+        'projects_per_minute': round(len(projects) / elapsed * 60, 1),
+        'verdicts': {verdict: results.count(verdict) for verdict in set(results)},
+        'latency': {
+            stage: {
+                'calls': len(values),
+                'p50': round(percentile(values, 50), 3),
+                'p90': round(percentile(values, 90), 3),
+                'p99': round(percentile(values, 99), 3)
+            }
+            for stage, values in timings.items()
+        },
+        'analysis': ai_service.get_analysis_stats(),
+        'cache': ai_service.get_cache_stats(),
+        'pricing': ai_service.get_pricing_stats(),
+        'generation': ai_service.get_generation_stats(),
+        'llm_pool': ai_service.get_llm_pool_stats(),
+        'llm': state.get_stats()
+    }
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("=" * 50)
+    print(f"Elapsed:            {report['elapsed_seconds']}s")
+    print(f"Projects:           {report['projects']} ({report['projects_per_minute']}/min)")
+    print(f"Verdicts:           {report['verdicts']}")
+    for stage, stats in report['latency'].items():
+        print(f"{stage.capitalize() + ' latency:':<20}{stats}")
+    print(f"Analysis:           {report['analysis']}")
+    print(f"LLM cache:          {report['cache']}")
+    print(f"Local pricing:      {report['pricing']}")
+    for kind, stats in report['generation'].items():
+        if stats['calls']:
+            print(f"{'Generation ' + kind + ':':<21}{stats}")
+    pool = report['llm_pool']
+    print(f"Provider pool:      {pool['calls']} calls, {pool['failovers']} failovers, {pool['model_fallbacks']} model fallbacks, {pool['waited_seconds']}s waited")
+    for provider in pool['providers']:
+        print(f"  {provider}")
+    print(f"LLM requests:       {report['llm']['requests']}")
+    print(f"LLM 429s:           {report['llm']['rate_limited']}")
+    print(f"LLM tokens:         {report['llm']['prompt_tokens']} in / {report['llm']['completion_tokens']} out")
+    print("=" * 50)
+
+def main():
+    print_report(run(build_arg_parser().parse_args()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+"""
+Local stand-in for the Freelancer.com API endpoints used by FreelancerService.
+
+Replays a project stream built from fixtures at a configurable rate and can
+inject latency and 429 responses. Run it standalone with
+
+    python -m benchmarks.freelancer_stub --port 8765 --rate 2
+
+and point the bot at it with FREELANCER_API_URL=http://127.0.0.1:8765.
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from typing import List, Dict, Any, Optional
+
+FIXTURES_FILE = Path(__file__).parent / "fixtures" / "projects.json"
+
+SELF_USER_ID = 1
+
+class ProjectStream:
+    """
+    Releases projects built from fixture templates at a fixed rate.
+    """
+
+    def __init__(self, templates: List[Dict[str, Any]], rate_per_second: float = 1.0,
+                 owner_pool: int = 50, initial_projects: int = 10):
+        self.templates = templates
+        self.rate_per_second = rate_per_second
+        self.owner_pool = max(1, owner_pool)
+        self.initial_projects = initial_projects
+        self.started_at = time.time()
+        self._projects: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _build(self, index: int) -> Dict[str, Any]:
+        """Build the index-th project of the stream"""
+        template = self.templates[index % len(self.templates)]
+        released_at = self.started_at + (index - self.initial_projects) / self.rate_per_second
+        project_id = 100000 + index
+        return {
+            'id': project_id,
+            'owner_id': 500000 + index % self.owner_pool,
+            'title': template['title'],
+            'description': template['description'],
+            'preview_description': template['description'][:200],
+            'seo_url': f"stub-project-{project_id}",
+            'type': template.get('type', 'fixed'),
+            'currency': template.get('currency', {'code': 'USD', 'exchange_rate': 1}),
+            'budget': template.get('budget', {'minimum': 30, 'maximum': 250}),
+            'jobs': template.get('jobs', []),
+            'language': template.get('language', 'en'),
+            'status': 'active',
+            'upgrades': {'NDA': index % 17 == 16},
+            'submitdate': int(released_at),
+            'time_submitted': int(released_at),
+            'time_updated': released_at,
+            '_released_at': released_at,
+            '_owner_country': template.get('owner_country', 'United States'),
+        }
+
+    def released(self) -> List[Dict[str, Any]]:
+        """
+        Get every project released so far, newest first.
+        """
+        count = self.initial_projects + int((time.time() - self.started_at) * self.rate_per_second)
+        with self._lock:
+            for index in range(len(self._projects), count):
+                project = self._build(index)
+                self._projects[project['id']] = project
+            return sorted(self._projects.values(), key=lambda p: (p['time_updated'], p['id']), reverse=True)
+
+    def get(self, project_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._projects.get(project_id)
+
+    def owner(self, owner_id: int) -> Dict[str, Any]:
+        """Build the users API record of an owner"""
+        with self._lock:
+            country = next(
+                (p['_owner_country'] for p in self._projects.values() if p['owner_id'] == owner_id),
+                'United States'
+            )
+        return {
+            'id': owner_id,
+            'username': f"client{owner_id}",
+            'location': {'country': {'name': country}},
+            'employer_reputation': {'entire_history': {'overall': 4.8, 'reviews': 12}},
+        }
+
+def public_project(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Strip stub bookkeeping fields from a project"""
+    return {key: value for key, value in project.items() if not key.startswith('_')}
+
+class StubState:
+    """
+    Stream, fault injection settings and counters shared by request handlers.
+    """
+
+    def __init__(self, stream: ProjectStream, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, retry_after: float = 1.0):
+        self.stream = stream
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.rate_limited = 0
+        self.bids: List[Dict[str, Any]] = []
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.requests[name] = self.requests.get(name, 0) + 1
+
+    def time_to_bid(self) -> List[float]:
+        """
+        Seconds from each bid project's release to its bid being placed.
+        """
+        with self.lock:
+            return [bid['time_to_bid'] for bid in self.bids]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'requests': dict(self.requests),
+                'rate_limited': self.rate_limited,
+                'bids': len(self.bids),
+                'released_projects': len(self.stream._projects)
+            }
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str] = None) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _inject_faults(self) -> bool:
+        """Sleep for the configured latency; return True if a 429 was sent"""
+        state = self.state
+        if state.latency_ms or state.jitter_ms:
+            delay = random.uniform(max(0.0, state.latency_ms - state.jitter_ms), state.latency_ms + state.jitter_ms)
+            time.sleep(delay / 1000)
+
+        if state.error_rate and random.random() < state.error_rate:
+            with state.lock:
+                state.rate_limited += 1
+            self._send_json(429, {
+                'status': 'error',
+                'message': 'You have made too many of these requests',
+                'error_code': 'ExceptionCodes.RATE_LIMITED',
+                'request_id': 'stub'
+            }, headers={'Retry-After': str(state.retry_after)})
+            return True
+        return False
+
+    def _not_found(self) -> None:
+        self._send_json(404, {'status': 'error', 'message': 'Not found', 'error_code': 'NOT_FOUND', 'request_id': 'stub'})
+
+    def do_GET(self):
+        if self._inject_faults():
+            return
+
+        url = urlparse(self.path)
+        path = url.path.rstrip('/')
+        query = parse_qs(url.query)
+        stream = self.state.stream
+
+        if path == '/api/users/0.1/self':
+            self.state.count('self')
+            self._send_json(200, {'status': 'success', 'result': {'id': SELF_USER_ID}})
+
+        elif path == '/api/projects/0.1/projects/all':
+            self.state.count('search')
+            limit = int(query.get('limit', ['10'])[0])
+            offset = int(query.get('offset', ['0'])[0])
+            projects = stream.released()[offset:offset + limit]
+            self._send_json(200, {'status': 'success', 'result': {
+                'projects': [public_project(p) for p in projects],
+                'total_count': len(projects)
+            }})
+
+        elif path == '/api/projects/0.1/projects':
+            self.state.count('projects')
+            projects = [stream.get(int(project_id)) for project_id in query.get('projects[]', [])]
+            projects = [p for p in projects if p]
+            users = {}
+            if query.get('user_details'):
+                users = {str(p['owner_id']): stream.owner(p['owner_id']) for p in projects}
+            self._send_json(200, {'status': 'success', 'result': {
+                'projects': [public_project(p) for p in projects],
+                'users': users
+            }})
+
+        elif path.startswith('/api/users/0.1/users/'):
+            self.state.count('users')
+            self._send_json(200, {'status': 'success', 'result': stream.owner(int(path.rsplit('/', 1)[1]))})
+
+        elif path == '/api/projects/0.1/bids':
+            self.state.count('get_bids')
+            with self.state.lock:
+                bids = [
+                    {'id': bid['id'], 'project_id': bid['project_id'], 'bidder_id': SELF_USER_ID}
+                    for bid in self.state.bids
+                ]
+            self._send_json(200, {'status': 'success', 'result': {'bids': bids}})
+
+        else:
+            self._not_found()
+
+    def do_POST(self):
+        if self._inject_faults():
+            return
+
+        path = urlparse(self.path).path.rstrip('/')
+        if path != '/api/projects/0.1/bids':
+            self._not_found()
+            return
+
+        self.state.count('place_bid')
+        length = int(self.headers.get('Content-Length', 0))
+        bid = json.loads(self.rfile.read(length) or b'{}')
+        project = self.state.stream.get(int(bid.get('project_id', 0)))
+        if project is None:
+            self._not_found()
+            return
+
+        with self.state.lock:
+            bid_id = 900000 + len(self.state.bids)
+            self.state.bids.append({
+                'id': bid_id,
+                'project_id': project['id'],
+                'amount': bid.get('amount'),
+                'period': bid.get('period'),
+                'time_to_bid': time.time() - project['_released_at']
+            })
+        self._send_json(200, {'status': 'success', 'result': {
+            'id': bid_id, 'project_id': project['id'], 'bidder_id': SELF_USER_ID
+        }})
+
+    def do_PUT(self):
+        if self._inject_faults():
+            return
+
+        self.state.count('seal')
+        self._send_json(200, {'status': 'success', 'result': {}})
+
+def load_templates(fixtures_file: Path = FIXTURES_FILE) -> List[Dict[str, Any]]:
+    """
+    Load recorded project templates from a fixtures file.
+    """
+    with open(fixtures_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def start_stub_server(state: StubState, host: str = '127.0.0.1', port: int = 0) -> ThreadingHTTPServer:
+    """
+    Start the stub server in a background thread; port 0 picks a free port.
+    """
+    handler = type('BoundStubRequestHandler', (StubRequestHandler,), {'state': state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add stream and fault injection options to an argument parser.
+    """
+    parser.add_argument('--fixtures', type=Path, default=FIXTURES_FILE, help='Project templates JSON file')
+    parser.add_argument('--rate', type=float, default=1.0, help='Projects released per second')
+    parser.add_argument('--initial-projects', type=int, default=10, help='Projects already posted at start')
+    parser.add_argument('--owner-pool', type=int, default=50, help='Distinct project owners (repeat clients)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Mean response latency')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Uniform latency jitter')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds on injected 429s')
+
+def state_from_args(args: argparse.Namespace) -> StubState:
+    """
+    Build stub state from parsed arguments.
+    """
+    stream = ProjectStream(
+        load_templates(args.fixtures),
+        rate_per_second=args.rate,
+        owner_pool=args.owner_pool,
+        initial_projects=args.initial_projects
+    )
+    return StubState(
+        stream,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Freelancer API stand-in')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    server = start_stub_server(state_from_args(args), args.host, args.port)
+    print(f"Freelancer API stub listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
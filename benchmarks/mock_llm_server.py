@@ -0,0 +1,369 @@
+"""
+Local Groq/OpenAI-compatible chat completions server for load tests.
+
+Answers the prompts AIService sends with deterministic output: MATCH / NO
+MATCH verdicts from keyword rules, "Budget: X USD, Deadline: Y days" strings,
+short bid texts and combined analysis JSON. Latency, token throughput,
+tokens-per-minute limits and <think> blocks are configurable. Run it standalone with
+
+    python -m benchmarks.mock_llm_server --port 8766 --llm-latency-ms 300
+
+and point AIService at it with GROQ_API_BASE=http://127.0.0.1:8766.
+"""
+import re
+import json
+import math
+import time
+import random
+import hashlib
+import argparse
+import threading
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse
+from typing import List, Dict, Any, Optional, Tuple
+
+CHAT_COMPLETIONS_PATHS = {'/openai/v1/chat/completions', '/v1/chat/completions'}
+
+MATCH_KEYWORDS = (
+    'website', 'wordpress', 'shopify', 'wix', 'ecommerce', 'e-commerce', 'landing page', 'react',
+    'logo', 'brand', 'illustration', 'vector', 'brochure', 'flyer', 'banner', 'graphic', 'ui/ux',
+    'ui ux', 'powerpoint', 'pitch deck', 'ppt', 'packaging', 'menu design', 'sticker'
+)
+NO_MATCH_KEYWORDS = ('laravel', 'fix bugs', 'maintain', 'maintenance', 'data entry', 'django', 'python script')
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count used for usage figures and throughput limits.
+    """
+    return max(1, math.ceil(len(text) / 4))
+
+def parse_field(text: str, name: str) -> str:
+    """Read a 'Name: value' line from a prompt"""
+    match = re.search(rf"{re.escape(name)}:\s*(.*)", text)
+    return match.group(1).strip() if match else ''
+
+def mock_verdict(title: str, description: str) -> str:
+    """
+    Deterministic MATCH / NO MATCH verdict from keyword rules.
+    """
+    text = f"{title} {description}".lower()
+    if any(keyword in text for keyword in NO_MATCH_KEYWORDS):
+        return 'NO MATCH'
+    if any(keyword in text for keyword in MATCH_KEYWORDS):
+        return 'MATCH'
+    return 'NO MATCH'
+
+def mock_budget_deadline(title: str, description: str, budget_min: float, budget_max: float) -> Tuple[int, int]:
+    """
+    Deterministic budget (USD) and deadline (days) for a project.
+    """
+    digest = int(hashlib.sha1(f"{title}\n{description}".encode('utf-8')).hexdigest(), 16)
+    budget = max(budget_min, min(budget_max, 50 + digest % 500)) if budget_max else 50 + digest % 500
+    return int(round(budget)), 2 + digest % 12
+
+def mock_bid_text(title: str) -> str:
+    """
+    Short deterministic bid text.
+    """
+    return (
+        f"Your {title.lower()} needs a clear result, and that is what I deliver. "
+        "I have completed similar projects with measurable outcomes for clients in your niche.\n\n"
+        "What is your ideal timeline? Do you have brand guidelines to follow?\n\n"
+        "Here's my previous related work according to your needs:\n"
+        "https://example.com/portfolio\n\n"
+        "Regards,\nBenchmark"
+    )
+
+def build_reply(messages: List[Dict[str, Any]], invalid_json_rate: float = 0.0) -> str:
+    """
+    Produce the assistant reply for an AIService prompt.
+    """
+    system = '\n'.join(m.get('content', '') for m in messages if m.get('role') == 'system')
+    human = '\n'.join(m.get('content', '') for m in messages if m.get('role') == 'user')
+
+    title = parse_field(human, 'Project Title')
+    description = parse_field(human, 'Project Description')
+
+    if 'Respond with a single JSON object' in system:
+        if invalid_json_rate and random.random() < invalid_json_rate:
+            return '{"verdict": "MATCH", "bid_content": '
+        verdict = mock_verdict(title, description)
+        analysis = {'verdict': verdict, 'budget': None, 'deadline': None, 'bid_content': ''}
+        if verdict == 'MATCH':
+            analysis['bid_content'] = mock_bid_text(title or 'project')
+            if parse_field(human, 'Project Type').lower() == 'fixed':
+                budget_min = float(parse_field(human, 'Minimum Budget') or 0)
+                budget_max = float(parse_field(human, 'Maximum Budget') or 0)
+                analysis['budget'], analysis['deadline'] = mock_budget_deadline(title, description, budget_min, budget_max)
+        return json.dumps(analysis)
+
+    if 'one line per project' in system:
+        # Batched match check: "Project N" blocks, one verdict line each
+        parts = re.split(r'(?m)^Project (\d+)\s*$', human)
+        lines = [
+            f"{number}: {mock_verdict(parse_field(block, 'Project Title'), parse_field(block, 'Project Description'))}"
+            for number, block in zip(parts[1::2], parts[2::2])
+        ]
+        if invalid_json_rate and random.random() < invalid_json_rate:
+            lines = lines[:-1]
+        return '\n'.join(lines)
+
+    if "'MATCH' or 'NO MATCH'" in system:
+        return mock_verdict(title, description)
+
+    if 'Budget: <budget> USD' in system or 'Budget: <budget> USD' in human:
+        budget_min = float(parse_field(human, 'Minimum Budget') or 0)
+        budget_max = float(parse_field(human, 'Maximum Budget') or 0)
+        budget, deadline = mock_budget_deadline(title, description, budget_min, budget_max)
+        return f"Budget: {budget} USD, Deadline: {deadline} days"
+
+    return mock_bid_text(title or 'project')
+
+def apply_limits(content: str, max_tokens: Optional[int], stop: Optional[List[str]]) -> Tuple[str, str]:
+    """
+    Apply stop sequences and max_tokens, returning content and finish reason.
+    """
+    for sequence in stop or []:
+        index = content.find(sequence)
+        if sequence and index != -1:
+            content = content[:index]
+
+    if max_tokens and estimate_tokens(content) > max_tokens:
+        return content[:max_tokens * 4], 'length'
+    return content, 'stop'
+
+class LatencyProfile:
+    """
+    Response latency: a base delay drawn from a distribution plus output
+    tokens divided by the generation speed.
+    """
+
+    def __init__(self, distribution: str = 'fixed', latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 tokens_per_second: float = 0.0):
+        self.distribution = distribution
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.tokens_per_second = tokens_per_second
+
+    def base_seconds(self) -> float:
+        if self.distribution == 'uniform':
+            value = random.uniform(self.latency_ms - self.jitter_ms, self.latency_ms + self.jitter_ms)
+        elif self.distribution == 'normal':
+            value = random.gauss(self.latency_ms, self.jitter_ms)
+        elif self.distribution == 'lognormal' and self.latency_ms > 0:
+            sigma = self.jitter_ms / self.latency_ms if self.jitter_ms else 0.5
+            value = random.lognormvariate(math.log(self.latency_ms), sigma)
+        else:
+            value = self.latency_ms
+        return max(0.0, value) / 1000
+
+    def seconds(self, output_tokens: int) -> float:
+        generation = output_tokens / self.tokens_per_second if self.tokens_per_second else 0.0
+        return self.base_seconds() + generation
+
+class TokenRateLimit:
+    """
+    Sliding one-minute tokens-per-minute limit, like Groq's TPM quota.
+    """
+
+    def __init__(self, tokens_per_minute: int = 0):
+        self.tokens_per_minute = tokens_per_minute
+        self._window: deque = deque()
+        self._lock = threading.Lock()
+
+    def try_consume(self, tokens: int) -> float:
+        """Record usage, or return seconds to wait if over the limit"""
+        if not self.tokens_per_minute:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            while self._window and self._window[0][0] <= now - 60:
+                self._window.popleft()
+
+            used = sum(count for _, count in self._window)
+            if used + tokens > self.tokens_per_minute and self._window:
+                return self._window[0][0] + 60 - now
+
+            self._window.append((now, tokens))
+            return 0.0
+
+    def headers(self) -> Dict[str, str]:
+        """Groq-style x-ratelimit-* headers for the current window"""
+        if not self.tokens_per_minute:
+            return {}
+        with self._lock:
+            now = time.monotonic()
+            used = sum(count for at, count in self._window if at > now - 60)
+            reset = self._window[0][0] + 60 - now if self._window else 0.0
+        return {
+            'x-ratelimit-limit-tokens': str(self.tokens_per_minute),
+            'x-ratelimit-remaining-tokens': str(max(0, self.tokens_per_minute - used)),
+            'x-ratelimit-reset-tokens': f"{max(0.0, reset):.2f}s"
+        }
+
+class MockLLMState:
+    """
+    Settings and counters shared by request handlers.
+    """
+
+    def __init__(self, latency: LatencyProfile, tokens_per_minute: int = 0, think_tokens: int = 0,
+                 invalid_json_rate: float = 0.0, model_speed: Dict[str, float] = None):
+        self.latency = latency
+        self.model_speed = model_speed or {}
+        self.tokens_per_minute = tokens_per_minute
+        self.rate_limits: Dict[str, TokenRateLimit] = {}
+        self.think_tokens = think_tokens
+        self.invalid_json_rate = invalid_json_rate
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def rate_limit(self, api_key: str) -> TokenRateLimit:
+        """Get the TPM window of an API key; each key has its own quota"""
+        with self.lock:
+            if api_key not in self.rate_limits:
+                self.rate_limits[api_key] = TokenRateLimit(self.tokens_per_minute)
+            return self.rate_limits[api_key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'rate_limited': self.rate_limited,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens
+            }
+
+class MockLLMRequestHandler(BaseHTTPRequestHandler):
+    state: MockLLMState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str] = None) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip('/') not in CHAT_COMPLETIONS_PATHS:
+            self._send_json(404, {'error': {'message': 'Not found', 'type': 'invalid_request_error'}})
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        messages = request.get('messages', [])
+        state = self.state
+
+        content = build_reply(messages, state.invalid_json_rate)
+        if state.think_tokens and request.get('reasoning_effort') != 'none':
+            content = f"<think>\n{'reasoning ' * state.think_tokens}\n</think>\n\n{content}"
+
+        stop = request.get('stop')
+        if isinstance(stop, str):
+            stop = [stop]
+        content, finish_reason = apply_limits(content, request.get('max_tokens') or request.get('max_completion_tokens'), stop)
+
+        prompt_tokens = sum(estimate_tokens(m.get('content') or '') for m in messages)
+        completion_tokens = estimate_tokens(content)
+
+        rate_limit = state.rate_limit(self.headers.get('Authorization', ''))
+        retry_after = rate_limit.try_consume(prompt_tokens + completion_tokens)
+        if retry_after:
+            with state.lock:
+                state.rate_limited += 1
+            self._send_json(429, {'error': {
+                'message': 'Rate limit reached for model: tokens per minute (TPM)',
+                'type': 'tokens',
+                'code': 'rate_limit_exceeded'
+            }}, headers={'Retry-After': f"{retry_after:.2f}"})
+            return
+
+        time.sleep(state.latency.seconds(completion_tokens) * state.model_speed.get(request.get('model'), 1.0))
+
+        with state.lock:
+            state.requests += 1
+            state.prompt_tokens += prompt_tokens
+            state.completion_tokens += completion_tokens
+
+        self._send_json(200, {
+            'id': f"chatcmpl-mock-{time.time_ns()}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'mock'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': finish_reason
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens
+            }
+        }, headers=rate_limit.headers())
+
+def start_mock_llm_server(state: MockLLMState, host: str = '127.0.0.1', port: int = 0) -> ThreadingHTTPServer:
+    """
+    Start the mock LLM server in a background thread; port 0 picks a free port.
+    """
+    handler = type('BoundMockLLMRequestHandler', (MockLLMRequestHandler,), {'state': state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def add_mock_llm_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add latency, rate limit and reasoning options to an argument parser.
+    """
+    parser.add_argument('--llm-distribution', choices=['fixed', 'uniform', 'normal', 'lognormal'], default='fixed',
+                        help='Base latency distribution')
+    parser.add_argument('--llm-latency-ms', type=float, default=0.0, help='Mean base latency per call')
+    parser.add_argument('--llm-jitter-ms', type=float, default=0.0, help='Latency spread (range or std dev)')
+    parser.add_argument('--llm-tokens-per-second', type=float, default=0.0, help='Output generation speed, 0 for instant')
+    parser.add_argument('--llm-tpm-limit', type=int, default=0, help='Tokens per minute per API key before 429s, 0 for unlimited')
+    parser.add_argument('--llm-think-tokens', type=int, default=0, help='Length of <think> block prepended to replies unless reasoning_effort is none')
+    parser.add_argument('--llm-model-speed', action='append', default=[], metavar='MODEL=FACTOR',
+                        help='Latency multiplier for a model, e.g. llama-3.1-8b-instant=0.25 (repeatable)')
+    parser.add_argument('--llm-invalid-json-rate', type=float, default=0.0,
+                        help='Fraction of combined analysis replies returned as broken JSON and batched verdicts missing a line')
+
+def mock_llm_state_from_args(args: argparse.Namespace) -> MockLLMState:
+    """
+    Build mock LLM state from parsed arguments.
+    """
+    return MockLLMState(
+        LatencyProfile(args.llm_distribution, args.llm_latency_ms, args.llm_jitter_ms, args.llm_tokens_per_second),
+        args.llm_tpm_limit,
+        think_tokens=args.llm_think_tokens,
+        invalid_json_rate=args.llm_invalid_json_rate,
+        model_speed={model: float(factor) for model, factor in (item.rsplit('=', 1) for item in args.llm_model_speed)}
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Groq-compatible mock LLM server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    add_mock_llm_arguments(parser)
+    args = parser.parse_args()
+
+    server = start_mock_llm_server(mock_llm_state_from_args(args), args.host, args.port)
+    print(f"Mock LLM listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
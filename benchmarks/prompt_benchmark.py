@@ -0,0 +1,89 @@
+"""
+Micro-benchmark of the per-call prompt overhead in AIService: compiling
+the ChatPromptTemplate and prompt | model chain on every call against
+reusing the ones compiled for the current configuration version.
+
+    python -m benchmarks.prompt_benchmark --iterations 2000
+
+No LLM calls are made.
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+from pathlib import Path
+from typing import Dict, Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+def time_per_call(call: Callable[[], Any], iterations: int) -> float:
+    """Mean microseconds per call"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Measure prompt and chain compilation overhead per AIService call')
+    parser.add_argument('--iterations', type=int, default=2000, help='Calls timed per call type')
+    return parser
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    os.environ.setdefault('GROQ_API_KEY', 'benchmark-key')
+
+    from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate
+    from src.ai_service import AIService, GENERATION_PROFILES
+    from src.config_manager import ConfigManager
+
+    config = ConfigManager(str(Path(tempfile.mkdtemp(prefix='prompt_bench_')) / 'config.json'))
+    ai_service = AIService(config_manager_instance=config)
+    provider = ai_service.llm_pool.providers[0]
+
+    calls = {}
+    for kind in GENERATION_PROFILES:
+        prompt, _ = ai_service._get_prompt(kind)
+        messages = [
+            ('system' if isinstance(message, SystemMessagePromptTemplate) else 'human', message.prompt.template)
+            for message in prompt.messages
+        ]
+        kwargs = dict(GENERATION_PROFILES[kind])
+
+        def compiled(messages=messages, kwargs=kwargs):
+            # What every call did before: a new template and a new chain
+            return ChatPromptTemplate.from_messages(messages) | provider.llm.bind(**kwargs)
+
+        def cached(kind=kind, kwargs=kwargs):
+            return provider.chain(ai_service._get_prompt(kind)[0], kwargs)
+
+        calls[kind] = {
+            'compiled_us': round(time_per_call(compiled, args.iterations), 1),
+            'cached_us': round(time_per_call(cached, args.iterations), 1)
+        }
+
+    # A config change rebuilds every prompt once, on the next call
+    builds_before = ai_service.prompt_builds
+    config.set('service_offerings', 'Benchmark Offerings')
+    rebuild_us = time_per_call(lambda: ai_service._build_prompts(), max(1, args.iterations // 10))
+    rebuilt = 'Benchmark Offerings' in ai_service._get_prompt('match')[0].messages[0].prompt.template
+
+    return {
+        'calls': calls,
+        'rebuild_us': round(rebuild_us, 1),
+        'rebuilt_on_change': rebuilt and ai_service.prompt_builds == builds_before + 1
+    }
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("=" * 50)
+    for kind, stats in report['calls'].items():
+        saved = stats['compiled_us'] - stats['cached_us']
+        print(f"{kind + ':':<14}{stats['compiled_us']:>8}us compiled  {stats['cached_us']:>6}us cached  ({saved:.1f}us saved per call)")
+    print(f"Full rebuild:  {report['rebuild_us']}us per config change")
+    print(f"Rebuilt on config change: {report['rebuilt_on_change']}")
+    print("=" * 50)
+
+def main():
+    print_report(run(build_arg_parser().parse_args()))
+
+if __name__ == '__main__':
+    main()
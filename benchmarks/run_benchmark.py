@@ -0,0 +1,169 @@
+"""
+Benchmark FreelancerBot._run_bot_loop against the local Freelancer API stub.
+
+    python -m benchmarks.run_benchmark --duration 60 --rate 2 --latency-ms 80 --error-rate 0.02
+
+Reports projects/sec processed and time-to-bid percentiles, measured from
+each project's release in the stub stream to its bid being received.
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+import threading
+from pathlib import Path
+from typing import List, Dict, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.freelancer_stub import add_stub_arguments, state_from_args, start_stub_server
+from benchmarks.mock_llm_server import add_mock_llm_arguments, mock_llm_state_from_args, start_mock_llm_server
+
+class InstantAIService:
+    """
+    AIService stand-in that matches every project without calling an LLM,
+    so the benchmark measures the Freelancer side of the loop.
+    """
+
+    combined_analysis = False
+
+    def check_project_match(self, project: Dict[str, Any]) -> str:
+        return "MATCH"
+
+    def generate_bid_content(self, project: Dict[str, Any]) -> str:
+        return f"Benchmark bid for {project.get('project_title')}"
+
+    def analyze_budget_deadline(self, project: Dict[str, Any]) -> str:
+        return "Budget: 150 USD, Deadline: 5 days"
+
+    def compose_bid_template(self, bid_content: str) -> str:
+        return bid_content
+
+    def get_analysis_stats(self) -> Dict[str, int]:
+        return {'combined': 0, 'fallbacks': 0}
+
+    def get_cache_stats(self) -> None:
+        return None
+
+    def get_pricing_stats(self) -> None:
+        return None
+
+    def get_generation_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {}
+
+    def get_llm_pool_stats(self) -> None:
+        return None
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of values.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Benchmark the bot loop against a local Freelancer API stub')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds to run the bot loop')
+    parser.add_argument('--poll-interval', type=float, default=1.0, help='Bot sleep between loop iterations')
+    parser.add_argument('--search-limit', type=int, default=10, help='Projects per search page')
+    parser.add_argument('--ai', choices=['instant', 'mock'], default='instant',
+                        help='instant skips the LLM; mock runs AIService against the mock LLM server')
+    add_stub_arguments(parser)
+    add_mock_llm_arguments(parser)
+    return parser
+
+def prepare_environment(api_url: str, workdir: str) -> None:
+    """
+    Point the bot at the stub and a throwaway database before importing src.
+    """
+    os.environ['FREELANCER_API_URL'] = api_url
+    os.environ['FREELANCER_OAUTH_TOKEN'] = 'benchmark-token'
+    os.environ['DATABASE_URL'] = f"sqlite:///{Path(workdir) / 'benchmark.db'}"
+    os.environ.setdefault('GROQ_API_KEY', 'benchmark-key')
+    os.environ['SHARED_PROJECT_FEED'] = 'false'
+    os.chdir(workdir)
+
+def create_ai_service(args: argparse.Namespace, bot):
+    """
+    Create the AI service used by the benchmarked bot. In mock mode the
+    bot's own AIService already points at the mock LLM server.
+    """
+    if args.ai == 'mock':
+        return bot.ai_service
+    return InstantAIService()
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    state = state_from_args(args)
+    server = start_stub_server(state)
+    llm_state = llm_server = None
+    if args.ai == 'mock':
+        llm_state = mock_llm_state_from_args(args)
+        llm_server = start_mock_llm_server(llm_state)
+        os.environ['GROQ_API_BASE'] = f"http://127.0.0.1:{llm_server.server_address[1]}"
+    workdir = tempfile.mkdtemp(prefix='freelancer_bot_bench_')
+    prepare_environment(f"http://127.0.0.1:{server.server_address[1]}", workdir)
+
+    from src.bot import FreelancerBot
+
+    bot = FreelancerBot(
+        bid_limit=10 ** 6,
+        project_search_limit=args.search_limit,
+        min_wait_time=0
+    )
+    bot.poll_interval = args.poll_interval
+    bot.ai_service = create_ai_service(args, bot)
+
+    started_at = time.time()
+    thread = threading.Thread(target=bot.start, daemon=True)
+    thread.start()
+    time.sleep(args.duration)
+    bot.stop()
+    thread.join(timeout=args.poll_interval + 30)
+    elapsed = time.time() - started_at
+    server.shutdown()
+    if llm_server:
+        llm_server.shutdown()
+
+    time_to_bid = state.time_to_bid()
+    return {
+        'elapsed_seconds': round(elapsed, 2),
+        'projects_seen': len(bot.processed_project_ids),
+        'projects_per_second': round(len(bot.processed_project_ids) / elapsed, 3),
+        'bids_placed': len(time_to_bid),
+        'time_to_bid_p50': round(percentile(time_to_bid, 50), 3),
+        'time_to_bid_p90': round(percentile(time_to_bid, 90), 3),
+        'time_to_bid_p99': round(percentile(time_to_bid, 99), 3),
+        'time_to_bid_max': round(max(time_to_bid), 3) if time_to_bid else 0.0,
+        'stub': state.get_stats(),
+        'llm': llm_state.get_stats() if llm_state else None,
+        'bot': bot.get_status(),
+        'workdir': workdir
+    }
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("=" * 50)
+    print(f"Elapsed:            {report['elapsed_seconds']}s")
+    print(f"Projects seen:      {report['projects_seen']} ({report['projects_per_second']}/s)")
+    print(f"Bids placed:        {report['bids_placed']}")
+    print(f"Time to bid p50:    {report['time_to_bid_p50']}s")
+    print(f"Time to bid p90:    {report['time_to_bid_p90']}s")
+    print(f"Time to bid p99:    {report['time_to_bid_p99']}s")
+    print(f"Time to bid max:    {report['time_to_bid_max']}s")
+    print(f"Stub requests:      {report['stub']['requests']}")
+    print(f"Injected 429s:      {report['stub']['rate_limited']}")
+    print(f"Rate limiter:       {report['bot']['rate_limiter']}")
+    if report['llm']:
+        print(f"LLM requests:       {report['llm']['requests']} ({report['llm']['rate_limited']} 429s)")
+    if report['bot'].get('speculative_bids'):
+        print(f"Speculative bids:   {report['bot']['speculative_bids']}")
+    print("=" * 50)
+
+def main():
+    print_report(run(build_arg_parser().parse_args()))
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,7 @@ from .config import *
 from .models import *
 from .database import DatabaseService
 from .freelancer_service import FreelancerService
+from .async_freelancer_service import AsyncFreelancerService
 from .ai_service import AIService
 from .utils import *
 
@@ -2,52 +2,388 @@
 AI service for project analysis and bid generation
 """
 import re
-from typing import Dict, Any, Optional
-from langchain_groq import ChatGroq
+import time
+import threading
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from langchain_core.prompts import ChatPromptTemplate
 
-from .config import GROQ_API_KEY, BASE_PROJECT_COMPONENTS, PORTFOLIO_LINKS, SERVICE_OFFERINGS, BID_WRITING_STYLE, PORTFOLIO_LINKS_TEXT, SIGNATURE
+from .config import GROQ_API_KEY, GROQ_API_KEYS, GROQ_MODEL, GROQ_MATCH_MODEL, GROQ_BUDGET_MODEL, GROQ_BID_MODEL, GROQ_FALLBACK_MODELS, AI_COMBINED_ANALYSIS, PRICING_ENGINE_ENABLED, BASE_PROJECT_COMPONENTS, PORTFOLIO_LINKS, SERVICE_OFFERINGS, BID_WRITING_STYLE, PORTFOLIO_LINKS_TEXT, SIGNATURE
+from .config import AI_MATCH_BATCH_DESCRIPTION_CHARS, AI_REASONING_EFFORT, AI_REASONING_MODELS, AI_MATCH_MAX_TOKENS, AI_BUDGET_MAX_TOKENS, AI_BID_MAX_TOKENS, AI_ANALYSIS_MAX_TOKENS
 from .config_manager import config_manager
-from .utils import retry_on_failure, clean_llm_response
+from .utils import retry_on_failure, clean_llm_response, parse_project_analysis, parse_batch_verdicts, extract_budget_and_deadline
+from .llm_cache import fingerprint
+from .pricing_engine import PricingEngine
+from .llm_pool import get_llm_pool
+
+# Per-call generation settings. The verdict and budget replies are one line,
+# so they are capped tightly and stopped at the first newline. Batched match
+# checks get the verdict cap once per project.
+GENERATION_PROFILES = {
+    'match': {'max_tokens': AI_MATCH_MAX_TOKENS, 'stop': ['\n']},
+    'match_batch': {'max_tokens': AI_MATCH_MAX_TOKENS},
+    'budget': {'max_tokens': AI_BUDGET_MAX_TOKENS, 'stop': ['\n']},
+    'bid': {'max_tokens': AI_BID_MAX_TOKENS},
+    'analysis': {'max_tokens': AI_ANALYSIS_MAX_TOKENS}
+}
+
+# Default model per call type; the combined analysis writes the bid, so it uses the bid model
+STAGE_MODELS = {
+    'match': GROQ_MATCH_MODEL,
+    'match_batch': GROQ_MATCH_MODEL,
+    'budget': GROQ_BUDGET_MODEL,
+    'bid': GROQ_BID_MODEL,
+    'analysis': GROQ_BID_MODEL
+}
+
+# Session model setting used by call types that share another stage's model
+STAGE_SETTINGS = {'match_batch': 'match', 'analysis': 'bid'}
+
+class TruncatedResponseError(ValueError):
+    """A reply cut off by its max_tokens cap"""
+
+def is_verdict(response: str) -> bool:
+    return response.upper() in ('MATCH', 'NO MATCH')
+
+def is_budget(response: str) -> bool:
+    return extract_budget_and_deadline(response) != (None, None)
 
 class AIService:
-    def __init__(self, config_manager_instance=None):
+    def __init__(self, config_manager_instance=None, llm_cache=None, max_concurrency: Optional[int] = None):
         # Use session-specific config manager or fallback to global
         self.config_manager = config_manager_instance or config_manager
         
-        # Use configurable API key or fallback to default
+        # Use configurable API key or fallback to default, plus the pool's shared keys.
+        # GROQ_API_BASE points the clients at a compatible server such as benchmarks/mock_llm_server.py
         api_key = self.config_manager.get_groq_api_key() or GROQ_API_KEY
-        self.llm = ChatGroq(api_key=api_key, model_name="qwen/qwen3-32b")
+        self.stage_models = {
+            kind: self.config_manager.get_stage_model(STAGE_SETTINGS.get(kind, kind)) or model
+            for kind, model in STAGE_MODELS.items()
+        }
+        self.llm_pool = get_llm_pool(
+            [api_key] + GROQ_API_KEYS, [GROQ_MODEL] + list(self.stage_models.values()) + GROQ_FALLBACK_MODELS
+        )
+
+        # Combined mode: one JSON call per project, falling back to three calls on parse failure
+        self.combined_analysis = AI_COMBINED_ANALYSIS
+        self.analysis_stats = {'combined': 0, 'fallbacks': 0, 'batch_calls': 0, 'batch_projects': 0, 'batch_unparsed': 0}
+        self._stats_lock = threading.Lock()
+
+        # Caps LLM calls in flight across every thread using this service,
+        # e.g. match checks running alongside speculative bid writing
+        self._llm_slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+        # Suppress reasoning and cap output per call type; see GENERATION_PROFILES
+        self.reasoning_effort = AI_REASONING_EFFORT
+        self.generation_stats = {
+            kind: {'calls': 0, 'seconds': 0.0, 'output_tokens': 0, 'think_tokens': 0, 'truncated': 0, 'invalid': 0,
+                   'served_by': {}}
+            for kind in GENERATION_PROFILES
+        }
+
+        # Optional persistent cache for match checks and budget analysis
+        self.llm_cache = llm_cache
+
+        # Local pricing for projects that map onto a single base component
+        self.pricing_engine = PricingEngine() if PRICING_ENGINE_ENABLED else None
+
+        # Prompts compiled from the configuration, rebuilt when its version changes
+        self._prompts: Dict[str, Tuple[ChatPromptTemplate, str]] = {}
+        self._prompts_version = None
+        self._prompts_lock = threading.Lock()
+        self.prompt_builds = 0
+
+    def _cached_invoke(self, kind: str, version: str, inputs: Dict[str, Any],
+                       invoke: Callable[[], str], cacheable: Callable[[str], bool]) -> str:
+        """
+        Return a cached response for these prompt inputs, or invoke the LLM
+        and cache its response if it is well formed.
+        """
+        if self.llm_cache is None:
+            return invoke()
+        
+        key = self.llm_cache.make_key(kind, version, **inputs)
+        cached = self.llm_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        response = invoke()
+        if cacheable(response):
+            self.llm_cache.put(key, kind, response, time.perf_counter() - started)
+        return response
+
+    def _get_generation_settings(self, kind: str, model: str, max_tokens: Optional[int] = None,
+                                 capped: bool = True) -> Dict[str, Any]:
+        """
+        Generation settings for a call type on the model serving it. Token
+        caps only apply to models that don't reason or have reasoning
+        suppressed, since a capped reply would otherwise end inside the <think> block.
+        """
+        if model not in AI_REASONING_MODELS:
+            kwargs = dict(GENERATION_PROFILES[kind])
+        elif self.reasoning_effort:
+            kwargs = dict(GENERATION_PROFILES[kind], reasoning_effort=self.reasoning_effort)
+        else:
+            kwargs = {}
+        if max_tokens and 'max_tokens' in kwargs:
+            kwargs['max_tokens'] = max_tokens
+        if not capped:
+            kwargs.pop('max_tokens', None)
+        return kwargs
+
+    def _invoke(self, kind: str, prompt: ChatPromptTemplate, inputs: Dict[str, Any],
+                validate: Optional[Callable[[str], bool]] = None, max_tokens: Optional[int] = None,
+                capped: bool = True, allow_truncated: bool = True) -> str:
+        """
+        Run a prompt on the model and generation profile for its call type
+        and return the cleaned response, recording latency, token usage and
+        responses failing validation. With allow_truncated off, a reply cut
+        off by the token cap raises TruncatedResponseError.
+        """
+        if self._llm_slots:
+            self._llm_slots.acquire()
+        try:
+            started = time.perf_counter()
+            response = self.llm_pool.invoke(
+                prompt, inputs, model=self.stage_models[kind],
+                settings=lambda model: self._get_generation_settings(kind, model, max_tokens, capped)
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            if self._llm_slots:
+                self._llm_slots.release()
+        
+        cleaned = clean_llm_response(response.content)
+        usage = getattr(response, 'usage_metadata', None) or {}
+        # The pool may have served the call with a fallback model
+        served_by = response.response_metadata.get('model_name') or self.stage_models[kind]
+        with self._stats_lock:
+            stats = self.generation_stats[kind]
+            stats['calls'] += 1
+            stats['served_by'][served_by] = stats['served_by'].get(served_by, 0) + 1
+            stats['seconds'] += elapsed
+            stats['output_tokens'] += usage.get('output_tokens', 0)
+            # Rough count of reasoning tokens paid for and then thrown away
+            stats['think_tokens'] += (len(response.content) - len(cleaned)) // 4
+            truncated = response.response_metadata.get('finish_reason') == 'length'
+            stats['truncated'] += truncated
+            stats['invalid'] += validate is not None and not validate(cleaned)
+        if truncated and not allow_truncated:
+            raise TruncatedResponseError(f"{kind} reply was cut off by its token cap")
+        return cleaned
+
+    def _get_base_components_text(self) -> str:
+        """Format the base project components for prompts"""
+        return "\n".join([
+            f"- {name.replace('_', ' ').title()}: ${data['budget']}, {data['timeline']} days"
+            for name, data in BASE_PROJECT_COMPONENTS.items()
+        ])
+
+    def _get_bid_system_prompt(self) -> str:
+        """Build the bid writing instructions with portfolio links"""
+        # Use configurable portfolio links or fallback to default
+        portfolio_links_text = self.config_manager.get_portfolio_links() or PORTFOLIO_LINKS_TEXT or "\n".join([
+            f"{i+1}. {name.replace('_', ' ')} : {link}"
+            for i, (name, link) in enumerate(PORTFOLIO_LINKS.items())
+        ])
+        
+        # Use configurable bid writing style or fallback to default
+        bid_style = self.config_manager.get_bid_writing_style() or BID_WRITING_STYLE
+        signature = self.config_manager.get_signature() or SIGNATURE
+        system_prompt = bid_style.format(signature=signature)
+
+        return f'''{system_prompt}
+
+Portfolio LINKS:
+{portfolio_links_text}
+'''
     
-    @retry_on_failure()
-    def check_project_match(self, project: Dict[str, Any]) -> str:
+    def _build_prompts(self) -> Dict[str, Tuple[ChatPromptTemplate, str]]:
         """
-        Check if project matches our service offerings using LLM.
+        Compile the prompt of every call type from the current configuration,
+        with the version their cached responses are stored under.
         """
         # Use configurable service offerings or fallback to default
         service_offerings = self.config_manager.get_service_offerings() or SERVICE_OFFERINGS
+        base_components_text = self._get_base_components_text()
+        bid_system_prompt = self._get_bid_system_prompt()
         
-        system_prompt = f"""You are a professional project analyst. Evaluate the following project details and decide whether the project matches our service offerings. Respond with only 'MATCH' or 'NO MATCH'. If you are not completely sure about the project details, respond with 'NO MATCH'.
+        match_system_prompt = f"""You are a professional project analyst. Evaluate the following project details and decide whether the project matches our service offerings. Respond with only 'MATCH' or 'NO MATCH'. If you are not completely sure about the project details, respond with 'NO MATCH'.
 
 Our Service Offerings:
 {service_offerings}
 
 Only return 'MATCH' if the project description clearly fits these criteria. Otherwise, return 'NO MATCH'."""
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("human", "Project Title: {title}\nProject Description: {description}\nMinimum Budget: {minimum_budget}\nMaximum Budget: {maximum_budget}\n")
-        ])
+        batch_system_prompt = f"""You are a professional project analyst. Evaluate each of the numbered projects below and decide whether it matches our service offerings. If you are not completely sure about a project, its verdict is 'NO MATCH'.
+
+Our Service Offerings:
+{service_offerings}
+
+Only use 'MATCH' if the project description clearly fits these criteria. Respond with one line per project in the format '<number>: MATCH' or '<number>: NO MATCH' and nothing else."""
+
+        budget_system_prompt = f"""You are an expert project analyst. Below are the base project components with their associated budget and timeline:
+{base_components_text}
+IMPORTANT NOTE:
+set the DEADLINE EXACT AS THE DEADLINE SUGGESTED IN ABOVE RECOMMENDED BUDGET
+________________________
+Using these as your baseline, analyze the client's budget range and adjust the recommended project budget and deadline according to the following guidelines:
+1. The recommended budget must always be greater than or equal to the client's minimum budget.
+2. analyze the details very carfully and if it include more work then the client max budget then you can propose higher budget for that according to the requirments
+2. If the client's maximum budget is higher than the base budget, increase the recommended budget proportionally—but remain close to the base budget to keep it attractive and realistic.
+3. The project deadline should be close to the base project timeline, without extending it unnecessarily.
+4. For very low client budget ranges (e.g., $10–$30), do not generate an unrealistically high budget.
+5. Make sure to set the deadline close or exact to the recommended project deadline.
+6. Provide your final output in the exact format:
+   "Budget: <budget> USD, Deadline: <days> days"
+
+No additional text should be included in the output."""
+
+        analysis_system_prompt = f"""You are a professional project analyst and proposal writer. Evaluate the project, price it and write the bid in one step.
+
+1. VERDICT: decide whether the project matches our service offerings. Use "MATCH" only if the project description clearly fits; if you are not completely sure, use "NO MATCH".
+
+Our Service Offerings:
+{service_offerings}
+
+2. BUDGET AND DEADLINE (fixed price projects only): use these base project components as your baseline:
+{base_components_text}
+The budget in USD must be greater than or equal to the client's minimum budget and close to the base budget; propose more than the client's maximum only if the work clearly requires it. For very low client budgets (e.g. $10-$30) do not generate an unrealistically high budget. Set the deadline in days close or exact to the base component timeline. For hourly projects use null for both.
+
+3. BID CONTENT: write the bid following these instructions:
+{bid_system_prompt}
+
+Respond with a single JSON object and no other text:
+{{{{"verdict": "MATCH" or "NO MATCH", "budget": <integer USD or null>, "deadline": <integer days or null>, "bid_content": "<bid text, empty if NO MATCH>"}}}}"""
+
+        match_version = fingerprint(service_offerings, self.stage_models['match'])
+        return {
+            'match': (ChatPromptTemplate.from_messages([
+                ("system", match_system_prompt),
+                ("human", "Project Title: {title}\nProject Description: {description}\nMinimum Budget: {minimum_budget}\nMaximum Budget: {maximum_budget}\n")
+            ]), match_version),
+            'match_batch': (ChatPromptTemplate.from_messages([
+                ("system", batch_system_prompt),
+                ("human", "{projects}")
+            ]), match_version),
+            'budget': (ChatPromptTemplate.from_messages([
+                ("system", budget_system_prompt),
+                ("human", (
+                    "Project Title: {title}\n"
+                    "Project Description: {description}\n"
+                    "Minimum Budget: {budget_min}\n"
+                    "Maximum Budget: {budget_max}\n"
+                    "OUTPUT SHOULD ONLY BE IN THE FORMAT 'Budget: <budget> USD, Deadline: <days> days'. DO NOT INCLUDE ANY EXTRA TEXT. "
+                    "KEEP THIS IN MIND: BUDGET SHOULD ALWAYS BE GREATER THAN THE CLIENT'S MINIMUM BUDGET."
+                ))
+            ]), fingerprint(base_components_text, self.stage_models['budget'])),
+            'bid': (ChatPromptTemplate.from_messages([
+                ("system", bid_system_prompt),
+                ("human", "Project Title: {title}\nProject Description: {description}\n")
+            ]), ''),
+            'analysis': (ChatPromptTemplate.from_messages([
+                ("system", analysis_system_prompt),
+                ("human", (
+                    "Project Title: {title}\n"
+                    "Project Description: {description}\n"
+                    "Project Type: {project_type}\n"
+                    "Minimum Budget: {budget_min}\n"
+                    "Maximum Budget: {budget_max}\n"
+                ))
+            ]), '')
+        }
+
+    def _get_prompt(self, kind: str) -> Tuple[ChatPromptTemplate, str]:
+        """
+        Get the compiled prompt for a call type and its cache version,
+        recompiling all prompts if the configuration changed since.
+        """
+        version = self.config_manager.version
+        if version != self._prompts_version:
+            with self._prompts_lock:
+                if version != self._prompts_version:
+                    self._prompts = self._build_prompts()
+                    self._prompts_version = version
+                    self.prompt_builds += 1
+        return self._prompts[kind]
+    
+    @retry_on_failure()
+    def check_project_match(self, project: Dict[str, Any]) -> str:
+        """
+        Check if project matches our service offerings using LLM.
+        """
+        prompt, version = self._get_prompt('match')
+        inputs = self._get_match_inputs(project)
         
-        chain = prompt | self.llm
-        response = chain.invoke({
+        return self._cached_invoke(
+            'match', version, inputs,
+            lambda: self._invoke('match', prompt, inputs, is_verdict),
+            is_verdict
+        )
+
+    def _get_match_inputs(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """Match check prompt inputs, also used as the cache key"""
+        return {
             "title": project["project_title"],
             "description": project["project_description"],
             'minimum_budget': project["minimum_budget"],
             'maximum_budget': project["maximum_budget"],
-        })
+        }
+
+    def check_projects_match(self, projects: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Check several projects against our service offerings in one LLM call,
+        sending the offerings once. Cached verdicts are reused. Projects the
+        response gives no clear verdict for get None, to be checked one by one.
+        """
+        prompt, version = self._get_prompt('match_batch')
+        
+        verdicts: List[Optional[str]] = [None] * len(projects)
+        keys: List[Optional[str]] = [None] * len(projects)
+        pending = []
+        for index, project in enumerate(projects):
+            if self.llm_cache is not None:
+                keys[index] = self.llm_cache.make_key('match', version, **self._get_match_inputs(project))
+                cached = self.llm_cache.get(keys[index])
+                if cached is not None and is_verdict(cached):
+                    verdicts[index] = cached
+                    continue
+            pending.append(index)
+        
+        if len(pending) < 2:
+            return verdicts
         
-        return clean_llm_response(response.content)
+        blocks = []
+        for number, index in enumerate(pending, 1):
+            project = projects[index]
+            description = project["project_description"] or ''
+            if len(description) > AI_MATCH_BATCH_DESCRIPTION_CHARS:
+                description = description[:AI_MATCH_BATCH_DESCRIPTION_CHARS].rsplit(' ', 1)[0] + '...'
+            blocks.append(
+                f"Project {number}\nProject Title: {project['project_title']}\nProject Description: {description}\n"
+                f"Minimum Budget: {project['minimum_budget']}\nMaximum Budget: {project['maximum_budget']}"
+            )
+        
+        count = len(pending)
+        started = time.perf_counter()
+        response = self._invoke(
+            'match_batch', prompt, {"projects": "\n\n".join(blocks)},
+            lambda reply: None not in parse_batch_verdicts(reply, count),
+            max_tokens=GENERATION_PROFILES['match_batch']['max_tokens'] * count
+        )
+        seconds_per_project = (time.perf_counter() - started) / count
+        
+        parsed = parse_batch_verdicts(response, count)
+        for index, verdict in zip(pending, parsed):
+            verdicts[index] = verdict
+            if verdict is not None and self.llm_cache is not None:
+                self.llm_cache.put(keys[index], 'match', verdict, seconds_per_project)
+        
+        with self._stats_lock:
+            self.analysis_stats['batch_calls'] += 1
+            self.analysis_stats['batch_projects'] += count
+            self.analysis_stats['batch_unparsed'] += parsed.count(None)
+        return verdicts
 
     @retry_on_failure()
     def analyze_budget_deadline(self, project: Dict[str, Any]) -> str:
@@ -57,81 +393,118 @@ Only return 'MATCH' if the project description clearly fits these criteria. Othe
         if project['type'].lower() != 'fixed':
             return 'None'
         
-        # Create base components text
-        base_components_text = "\n".join([
-            f"- {name.replace('_', ' ').title()}: ${data['budget']}, {data['timeline']} days"
-            for name, data in BASE_PROJECT_COMPONENTS.items()
-        ])
+        # Clear cases are priced locally; ambiguous ones go to the LLM
+        if self.pricing_engine:
+            priced = self.pricing_engine.price(project)
+            if priced:
+                return f"Budget: {priced[0]} USD, Deadline: {priced[1]} days"
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", f"""You are an expert project analyst. Below are the base project components with their associated budget and timeline:
-{base_components_text}
-IMPORTANT NOTE:
-set the DEADLINE EXACT AS THE DEADLINE SUGGESTED IN ABOVE RECOMMENDED BUDGET
-________________________
-Using these as your baseline, analyze the client's budget range and adjust the recommended project budget and deadline according to the following guidelines:
-1. The recommended budget must always be greater than or equal to the client's minimum budget.
-2. analyze the details very carfully and if it include more work then the client max budget then you can propose higher budget for that according to the requirments
-2. If the client's maximum budget is higher than the base budget, increase the recommended budget proportionally—but remain close to the base budget to keep it attractive and realistic.
-3. The project deadline should be close to the base project timeline, without extending it unnecessarily.
-4. For very low client budget ranges (e.g., $10–$30), do not generate an unrealistically high budget.
-5. Make sure to set the deadline close or exact to the recommended project deadline.
-6. Provide your final output in the exact format:
-   "Budget: <budget> USD, Deadline: <days> days"
-
-No additional text should be included in the output."""),
-            ("human", (
-                "Project Title: {title}\n"
-                "Project Description: {description}\n"
-                "Minimum Budget: {budget_min}\n"
-                "Maximum Budget: {budget_max}\n"
-                "OUTPUT SHOULD ONLY BE IN THE FORMAT 'Budget: <budget> USD, Deadline: <days> days'. DO NOT INCLUDE ANY EXTRA TEXT. "
-                "KEEP THIS IN MIND: BUDGET SHOULD ALWAYS BE GREATER THAN THE CLIENT'S MINIMUM BUDGET."
-            ))
-        ])
+        prompt, version = self._get_prompt('budget')
         
-        chain = prompt | self.llm
-        response = chain.invoke({
+        inputs = {
             "title": project["project_title"],
             "description": project["project_description"],
             "budget_min": project["minimum_budget"] * project["exchange_rate"],
             "budget_max": project["maximum_budget"] * project["exchange_rate"],
-        })
+        }
         
-        return clean_llm_response(response.content)
+        return self._cached_invoke(
+            'budget', version, inputs,
+            lambda: self._invoke('budget', prompt, inputs, is_budget),
+            is_budget
+        )
 
     @retry_on_failure()
     def generate_bid_content(self, project: Dict[str, Any]) -> str:
         """
-        Generate bid content using LLM.
+        Generate bid content using LLM. A bid cut off by AI_BID_MAX_TOKENS is
+        never returned: it is written again once without the cap, and if
+        that is cut off too the error is left to the retry decorator.
         """
-        # Use configurable portfolio links or fallback to default
-        portfolio_links_text = self.config_manager.get_portfolio_links() or PORTFOLIO_LINKS_TEXT or "\n".join([
-            f"{i+1}. {name.replace('_', ' ')} : {link}"
-            for i, (name, link) in enumerate(PORTFOLIO_LINKS.items())
-        ])
-        
-        # Use configurable bid writing style or fallback to default
-        bid_style = self.config_manager.get_bid_writing_style() or BID_WRITING_STYLE
-        signature = self.config_manager.get_signature() or SIGNATURE
-        system_prompt = bid_style.format(signature=signature)
+        prompt, _ = self._get_prompt('bid')
+        inputs = {
+            "title": project["project_title"],
+            "description": project["project_description"],
+        }
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", f'''{system_prompt}
+        try:
+            return self._invoke('bid', prompt, inputs, bool, allow_truncated=False)
+        except TruncatedResponseError:
+            return self._invoke('bid', prompt, inputs, bool, capped=False, allow_truncated=False)
 
-Portfolio LINKS:
-{portfolio_links_text}
-'''),
-            ("human", "Project Title: {title}\nProject Description: {description}\n")
-        ])
-        
-        chain = prompt | self.llm
-        response = chain.invoke({
+    @retry_on_failure()
+    def analyze_project(self, project: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get match verdict, budget, deadline and bid content in a single LLM call.
+        Returns None if the response fails schema validation.
+        """
+        is_fixed = (project.get('type') or '').lower() == 'fixed'
+        prompt, _ = self._get_prompt('analysis')
+
+        response = self._invoke('analysis', prompt, {
             "title": project["project_title"],
             "description": project["project_description"],
+            "project_type": project.get("type") or "",
+            "budget_min": project["minimum_budget"] * project["exchange_rate"],
+            "budget_max": project["maximum_budget"] * project["exchange_rate"],
         })
-        
-        return clean_llm_response(response.content)
+
+        analysis = parse_project_analysis(response)
+        with self._stats_lock:
+            self.analysis_stats['combined' if analysis else 'fallbacks'] += 1
+            self.generation_stats['analysis']['invalid'] += analysis is None
+        if analysis and not is_fixed:
+            analysis['budget'] = None
+            analysis['deadline'] = None
+        return analysis
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get LLM cache hit rate and saved seconds, or None without a cache.
+        """
+        return self.llm_cache.get_stats() if self.llm_cache else None
+
+    def get_pricing_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get local pricing coverage, or None when the pricing engine is disabled.
+        """
+        return self.pricing_engine.get_stats() if self.pricing_engine else None
+
+    def get_llm_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get provider routing, failover and headroom stats.
+        """
+        return self.llm_pool.get_stats()
+
+    def get_generation_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the model, latency, output tokens and invalid response rate per
+        call type, with the calls each model actually served.
+        """
+        with self._stats_lock:
+            return {
+                kind: {
+                    'model': self.stage_models[kind],
+                    'calls': stats['calls'],
+                    'served_by': dict(stats['served_by']),
+                    'fallback_calls': sum(calls for model, calls in stats['served_by'].items()
+                                          if model != self.stage_models[kind]),
+                    'avg_latency_ms': round(stats['seconds'] / stats['calls'] * 1000, 1) if stats['calls'] else 0.0,
+                    'avg_output_tokens': round(stats['output_tokens'] / stats['calls'], 1) if stats['calls'] else 0.0,
+                    'think_tokens': stats['think_tokens'],
+                    'truncated': stats['truncated'],
+                    'invalid_rate': round(stats['invalid'] / stats['calls'], 4) if stats['calls'] else 0.0
+                }
+                for kind, stats in self.generation_stats.items()
+            }
+
+    def get_analysis_stats(self) -> Dict[str, int]:
+        """
+        Get combined analysis successes and fallbacks to separate calls, and
+        batched match check calls with the projects left without a verdict.
+        """
+        with self._stats_lock:
+            return dict(self.analysis_stats)
 
     def compose_bid_template(self, bid_content: str) -> str:
         """
@@ -0,0 +1,548 @@
+"""
+Asyncio-native Freelancer.com API service on a pooled keep-alive HTTP client
+"""
+import time
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+from freelancersdk.resources.projects.helpers import (
+    create_search_projects_filter,
+    create_get_projects_object,
+    create_get_projects_project_details_object,
+    create_get_projects_user_details_object
+)
+
+from .config import (
+    OAUTH_TOKEN, SKILL_IDS, LANGUAGE_CODES, UNWANTED_CURRENCIES, UNWANTED_COUNTRIES,
+    PROJECT_DETAILS_BATCH_SIZE, BID_LEDGER_RECONCILE_LIMIT,
+    FREELANCER_API_URL, FREELANCER_MAX_CONCURRENCY, FREELANCER_REQUEST_TIMEOUT,
+    FREELANCER_MAX_429_RETRIES, FREELANCER_DEFAULT_RETRY_AFTER
+)
+from .config_manager import config_manager
+from .owner_cache import owner_cache
+from .bid_ledger import BidLedger
+from .rate_limiter import get_rate_limiter, PRIORITY_BID, PRIORITY_NORMAL
+from .filter_chain import FilterChain, FilterPredicate, COST_LOCAL, COST_DETAILS, COST_NETWORK
+
+class FreelancerAPIError(Exception):
+    """
+    Freelancer API returned a non-200 response
+    """
+
+    def __init__(self, message, error_code=None, request_id=None, status_code=None):
+        super(FreelancerAPIError, self).__init__(message)
+        self.error_code = error_code
+        self.request_id = request_id
+        self.status_code = status_code
+
+class AsyncFreelancerService:
+    # Authenticated user IDs memoized per OAuth token
+    _self_user_ids: Dict[str, str] = {}
+    _self_user_ids_lock = threading.Lock()
+
+    projects_endpoint = 'api/projects/0.1'
+    users_endpoint = 'api/users/0.1'
+
+    def __init__(self, skill_ids: List[int] = None, language_codes: List[str] = None,
+                 unwanted_currencies: List[str] = None, unwanted_countries: List[str] = None,
+                 bid_ledger: BidLedger = None, oauth_token: str = None,
+                 max_concurrency: int = None, base_url: str = None):
+        # Use session OAuth token, configurable OAuth token or fallback to default
+        self.oauth_token = oauth_token or config_manager.get_oauth_token() or OAUTH_TOKEN
+        self.base_url = (base_url or FREELANCER_API_URL).rstrip('/')
+        self.max_concurrency = max_concurrency or FREELANCER_MAX_CONCURRENCY
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._search_filter = None
+
+        # Request budget shared by every service using this token
+        self.rate_limiter = get_rate_limiter(self.oauth_token)
+
+        # Set session-specific filtering parameters
+        self.skill_ids = skill_ids or SKILL_IDS
+        self.language_codes = language_codes or LANGUAGE_CODES
+        self.unwanted_currencies = unwanted_currencies or list(UNWANTED_CURRENCIES)
+        self.unwanted_countries = unwanted_countries or list(UNWANTED_COUNTRIES)
+
+        # Owner profiles are shared by every service in the process
+        self.owner_cache = owner_cache
+
+        # Projects we have already bid on
+        self.bid_ledger = bid_ledger or BidLedger()
+
+        # Project checks, cheapest first
+        self.filter_chain = self._build_filter_chain()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    'Freelancer-OAuth-V1': self.oauth_token,
+                    'User-Agent': 'Freelancer.com SDK',
+                },
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                timeout=FREELANCER_REQUEST_TIMEOUT
+            )
+        return self._client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Get or create the semaphore bounding concurrent API calls"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._semaphore = None
+
+    @property
+    def search_filter(self):
+        """Get or create search filter"""
+        if self._search_filter is None:
+            self._search_filter = create_search_projects_filter(
+                jobs=self.skill_ids,
+                languages=self.language_codes,
+                sort_field='time_updated',
+                or_search_query=True
+            )
+        return self._search_filter
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        """Get the Retry-After delay of a 429 response in seconds"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    return max(0.0, retry_at.timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        return FREELANCER_DEFAULT_RETRY_AFTER
+
+    async def send(self, method: str, path: str, priority: int = PRIORITY_NORMAL, **kwargs) -> httpx.Response:
+        """
+        Send a rate-limited request, waiting out and retrying 429 responses.
+        """
+        for attempt in range(FREELANCER_MAX_429_RETRIES + 1):
+            await self.rate_limiter.acquire(priority)
+            async with self.semaphore:
+                response = await self.client.request(method, path, **kwargs)
+
+            if response.status_code != 429 or attempt == FREELANCER_MAX_429_RETRIES:
+                return response
+
+            retry_after = self._retry_after(response)
+            print(f"Rate limited on {method} {path}, retrying in {retry_after:.1f}s")
+            self.rate_limiter.penalize(retry_after)
+
+        return response
+
+    async def request(self, method: str, api_endpoint: str, endpoint: str,
+                      priority: int = PRIORITY_NORMAL, **kwargs) -> Any:
+        """
+        Make a Freelancer API request and return its 'result' payload.
+
+        Raises FreelancerAPIError on non-200 responses.
+        """
+        response = await self.send(method, f"/{api_endpoint}/{endpoint}/", priority=priority, **kwargs)
+
+        try:
+            json_data = response.json()
+        except ValueError:
+            json_data = {'message': response.text}
+
+        if response.status_code != 200:
+            raise FreelancerAPIError(
+                message=json_data.get('message', f"HTTP {response.status_code}"),
+                error_code=json_data.get('error_code'),
+                request_id=json_data.get('request_id'),
+                status_code=response.status_code
+            )
+        return json_data.get('result')
+
+    async def get_self_user_id(self, refresh: bool = False) -> Optional[str]:
+        """
+        Get current user ID.
+
+        The ID is fetched once per OAuth token and memoized; pass refresh=True
+        (or call invalidate_self_user_id) to look it up again.
+        """
+        if not refresh:
+            cached_user_id = self._self_user_ids.get(self.oauth_token)
+            if cached_user_id:
+                return cached_user_id
+
+        try:
+            result = await self.request('GET', self.users_endpoint, 'self')
+            user_id = result['id']
+        except Exception as e:
+            print(f"Error getting self user ID: {e}")
+            return None
+
+        with self._self_user_ids_lock:
+            self._self_user_ids[self.oauth_token] = user_id
+        return user_id
+
+    def invalidate_self_user_id(self) -> None:
+        """Forget the memoized user ID for the current OAuth token"""
+        with self._self_user_ids_lock:
+            self._self_user_ids.pop(self.oauth_token, None)
+
+    @staticmethod
+    def is_auth_error(error: Exception) -> bool:
+        """Check whether an API error was caused by an invalid or expired token"""
+        if getattr(error, 'status_code', None) in (401, 403):
+            return True
+        error_code = str(getattr(error, 'error_code', '') or '').upper()
+        return 'AUTH' in error_code or 'TOKEN' in error_code
+
+    async def search_projects(self, limit: int = 10, offset: int = 0,
+                              project_details: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Search for projects using the configured filter.
+        """
+        search_data = {
+            'query': '',
+            'limit': limit,
+            'offset': offset,
+        }
+        search_data.update(self.search_filter)
+        if project_details:
+            search_data.update(project_details)
+
+        try:
+            result = await self.request('GET', self.projects_endpoint, 'projects/all', params=search_data)
+            return result.get('projects', [])
+        except Exception as e:
+            print(f"Error searching projects: {e}")
+            return []
+
+    async def get_user_by_id(self, user_id: int) -> Dict[str, Any]:
+        """
+        Get details about a specific user.
+        """
+        return await self.request('GET', self.users_endpoint, f'users/{user_id}', params={'compact': True})
+
+    def already_bid_on_project(self, project_id: str, my_user_id: str = None) -> bool:
+        """
+        Check if we have already bid on a project.
+
+        Uses the local bid ledger only; the bids API is consulted in bulk by
+        reconcile_bid_ledger.
+        """
+        return self.bid_ledger.has_bid(project_id)
+
+    async def reconcile_bid_ledger(self, my_user_id: str) -> int:
+        """
+        Merge our most recent bids from the bids API into the local ledger.
+        """
+        project_ids = []
+        try:
+            result = await self.request('GET', self.projects_endpoint, 'bids', params={
+                'bidders[]': [my_user_id],
+                'limit': BID_LEDGER_RECONCILE_LIMIT,
+                'offset': 0
+            })
+
+            for bid in (result or {}).get('bids', []):
+                if isinstance(bid, dict) and bid.get('bidder_id') == my_user_id:
+                    project_ids.append(bid.get('project_id'))
+        except Exception as e:
+            print(f"Error reconciling bid ledger: {e}")
+            return 0
+
+        return self.bid_ledger.merge(project_ids)
+
+    async def _get_projects_chunk(self, chunk: List[int]) -> Dict[str, Any]:
+        """Fetch complete details for one chunk of projects"""
+        details_obj = create_get_projects_object(
+            project_ids=chunk,
+            project_details=create_get_projects_project_details_object(
+                full_description=True,
+                jobs=True,
+                qualifications=True,
+                location=True,
+            ),
+            user_details=create_get_projects_user_details_object(
+                basic=True,
+                reputation=True,
+                location=True
+            ),
+            limit=len(chunk),
+        )
+        try:
+            return await self.request('GET', self.projects_endpoint, 'projects', params=details_obj) or {}
+        except Exception as e:
+            print(f"Error getting complete details for projects {chunk}: {e}")
+            return {}
+
+    async def get_projects_details(self, project_ids: List[int]) -> Tuple[Dict[int, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Fetch complete details for several projects, with chunks requested in parallel.
+
+        Returns the projects keyed by project ID and the owners returned
+        alongside them keyed by user ID (as a string).
+        """
+        details_by_id = {}
+        users_by_id = {}
+        batch_size = max(1, PROJECT_DETAILS_BATCH_SIZE)
+        chunks = [project_ids[start:start + batch_size] for start in range(0, len(project_ids), batch_size)]
+
+        for complete_details in await asyncio.gather(*(self._get_projects_chunk(chunk) for chunk in chunks)):
+            for project_data in complete_details.get('projects', []):
+                details_by_id[project_data.get('id')] = project_data
+
+            for user_id, user_data in (complete_details.get('users') or {}).items():
+                users_by_id[str(user_id)] = user_data
+
+        return details_by_id, users_by_id
+
+    async def get_owner_country(self, owner_id: int, users_by_id: Dict[str, Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Get the lowercase country name of a project owner.
+
+        Uses the user details returned with the projects response and only
+        falls back to a separate users API call when the owner is missing.
+        The result is stored in the shared owner cache. Only owners that do
+        not exist are cached as missing; a failed lookup (timeout, 429)
+        rejects the project for this poll only.
+        """
+        user_details = (users_by_id or {}).get(str(owner_id))
+
+        if user_details is None:
+            try:
+                user_details = await self.get_user_by_id(owner_id)
+            except FreelancerAPIError as e:
+                print(f"Error getting user details for {owner_id}: {e}")
+                if e.status_code == 404:
+                    self.owner_cache.put_missing(owner_id)
+                return None
+            except Exception as e:
+                print(f"Error getting user details for {owner_id}: {e}")
+                return None
+
+            if not user_details:
+                self.owner_cache.put_missing(owner_id)
+                return None
+
+        return self.owner_cache.put_user(owner_id, user_details)['country']
+
+    def _build_filter_chain(self) -> FilterChain:
+        """Build the default project filter chain"""
+        return FilterChain([
+            FilterPredicate('known_unwanted_owner', self._check_known_owner, COST_LOCAL),
+            FilterPredicate('already_bid', self._check_not_bid, COST_LOCAL),
+            FilterPredicate('currency', self._check_currency, COST_LOCAL),
+            FilterPredicate('nda', self._check_no_nda, COST_LOCAL),
+            FilterPredicate('status', self._check_active, COST_LOCAL),
+            FilterPredicate('project_details', self._check_details_found, COST_DETAILS),
+            FilterPredicate('fixed_budget', self._check_fixed_budget, COST_DETAILS),
+            FilterPredicate('owner_country', self._check_owner_country, COST_NETWORK),
+        ])
+
+    def _check_known_owner(self, context: Dict[str, Any]) -> bool:
+        """Reject owners already known to be in an unwanted country"""
+        context['cached_owner'] = self.owner_cache.get(context['project'].get('owner_id'))
+        return not self.owner_cache.is_unwanted(context['cached_owner'], self.unwanted_countries)
+
+    def _check_not_bid(self, context: Dict[str, Any]) -> bool:
+        """Reject projects we have already bid on"""
+        return not self.already_bid_on_project(context['project'].get('id'))
+
+    def _check_currency(self, context: Dict[str, Any]) -> bool:
+        """Reject unwanted currencies"""
+        return context['project'].get('currency', {}).get('code', '') not in self.unwanted_currencies
+
+    def _check_no_nda(self, context: Dict[str, Any]) -> bool:
+        """Reject projects requiring an NDA"""
+        return not context['project'].get('upgrades', {}).get('NDA', False)
+
+    def _check_active(self, context: Dict[str, Any]) -> bool:
+        """Reject projects that are not active"""
+        return context['project'].get('status', '').lower() == 'active'
+
+    def _check_details_found(self, context: Dict[str, Any]) -> bool:
+        """Reject projects missing from the get_projects response"""
+        return bool(context.get('project_data'))
+
+    def _check_fixed_budget(self, context: Dict[str, Any]) -> bool:
+        """Reject fixed projects with a maximum budget of 30 or less"""
+        if context['project'].get('type') != 'fixed':
+            return True
+        max_budget = (context.get('project_data') or {}).get('budget', {}).get('maximum', 0)
+        return max_budget > 30
+
+    async def _check_owner_country(self, context: Dict[str, Any]) -> bool:
+        """Reject owners in an unwanted country, looking them up if needed"""
+        cached_owner = context.get('cached_owner')
+        if cached_owner is not None:
+            country_name = cached_owner['country']
+        else:
+            country_name = await self.get_owner_country(context['project'].get('owner_id'), context.get('users_by_id'))
+        return country_name is not None and country_name not in self.unwanted_countries
+
+    async def filter_projects(self, projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Filter projects based on various criteria.
+
+        Local checks run first; projects that pass them are enriched with one
+        batched get_projects call before the detail and network checks run.
+        """
+        my_user_id = await self.get_self_user_id()
+
+        if my_user_id and self.bid_ledger.needs_reconciliation():
+            await self.reconcile_bid_ledger(my_user_id)
+
+        candidates = []
+        for project in projects:
+            if not project.get("owner_id") or not project.get('id'):
+                continue
+
+            context = {'project': project}
+            if await self.filter_chain.evaluate(context, COST_LOCAL):
+                candidates.append(context)
+
+        if not candidates:
+            return []
+
+        # Get complete project and owner details for all surviving candidates at once
+        details_by_id, users_by_id = await self.get_projects_details([context['project'].get('id') for context in candidates])
+        for context in candidates:
+            context['project_data'] = details_by_id.get(context['project'].get('id'))
+            context['users_by_id'] = users_by_id
+
+        # Run the remaining tiers for all candidates in parallel
+        kept = await asyncio.gather(*(self._evaluate_enriched(context) for context in candidates))
+
+        filtered_projects = []
+        for context, keep in zip(candidates, kept):
+            if not keep:
+                continue
+
+            project = context['project']
+            project_data = context['project_data']
+
+            # Add to filtered projects
+            filtered_projects.append({
+                'id': project.get('id'),
+                'owner_id': project.get("owner_id"),
+                'project_title': project_data.get('title'),
+                'project_description': project_data.get('description'),
+                'minimum_budget': project_data.get('budget', {}).get('minimum', 0),
+                'maximum_budget': project_data.get('budget', {}).get('maximum', 0),
+                'currency': project.get('currency', {}).get('code', ''),
+                'type': project.get('type'),
+                'exchange_rate': project.get("currency", {}).get("exchange_rate", 1),
+                'submitdate': project.get("submitdate"),
+                'seo_url': project.get("seo_url")
+            })
+
+        return filtered_projects
+
+    async def _evaluate_enriched(self, context: Dict[str, Any]) -> bool:
+        """Run the detail and network tiers for one enriched candidate"""
+        return (await self.filter_chain.evaluate(context, COST_DETAILS)
+                and await self.filter_chain.evaluate(context, COST_NETWORK))
+
+    def get_filter_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-predicate rejection and latency stats.
+        """
+        return self.filter_chain.get_stats()
+
+    async def make_put_request(self, endpoint: str, headers: Dict[str, str] = None,
+                               params_data: Dict[str, Any] = None, form_data: Dict[str, Any] = None,
+                               json_data: Dict[str, Any] = None,
+                               priority: int = PRIORITY_NORMAL) -> httpx.Response:
+        """Make PUT request to Freelancer API"""
+        return await self.send(
+            'PUT',
+            f"/{self.projects_endpoint}/{endpoint}",
+            priority=priority,
+            headers=headers,
+            params=params_data,
+            data=form_data,
+            json=json_data
+        )
+
+    async def highlight_project_bid(self, bid_id: str) -> bool:
+        """
+        Highlight (seal) a project bid.
+        """
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        bid_data = {'action': 'seal'}
+        endpoint = f'bids/{bid_id}'
+
+        try:
+            response = await self.make_put_request(endpoint, headers=headers, params_data=bid_data,
+                                                   priority=PRIORITY_BID)
+            json_data = response.json()
+
+            if response.status_code == 200:
+                return json_data.get('status') == 'success'
+            else:
+                print(f"Error highlighting bid {bid_id}: {json_data.get('message', 'Unknown error')}")
+                return False
+        except Exception as e:
+            print(f"Error highlighting bid {bid_id}: {e}")
+            return False
+
+    async def place_bid(self, project_id: str, bid_content: str, bid_amount: float,
+                        bid_period: int = 7) -> bool:
+        """
+        Place a bid on a project.
+        """
+        my_user_id = None
+        try:
+            my_user_id = await self.get_self_user_id()
+            if not my_user_id:
+                print("Could not get user ID")
+                return False
+
+            response = await self.request('POST', self.projects_endpoint, 'bids', priority=PRIORITY_BID, json={
+                'project_id': project_id,
+                'bidder_id': my_user_id,
+                'description': bid_content,
+                'amount': bid_amount,
+                'period': bid_period,
+                'milestone_percentage': 100,
+            })
+
+            if response:
+                self.bid_ledger.record(project_id)
+                print(f"✅ Successfully placed bid on project {project_id}")
+                print(bid_content)
+
+                # Try to highlight the bid
+                try:
+                    await self.highlight_project_bid(str(response.get('id')))
+                except Exception as e:
+                    print(f"❌ Error sealing bid {project_id}: {e}")
+
+                return True
+            else:
+                print(f"⚠️ Failed to place bid on project {project_id}")
+                return False
+
+        except Exception as e:
+            print(f"❌ Error placing bid on project {project_id}: {e}")
+            print(my_user_id)
+            if self.is_auth_error(e):
+                # The memoized user ID may belong to a stale token
+                self.invalidate_self_user_id()
+            return False
@@ -0,0 +1,52 @@
+"""
+Local ledger of projects we have already bid on
+"""
+import time
+import threading
+from typing import Iterable, Set, Any, Optional
+
+from .config import BID_LEDGER_RECONCILE_INTERVAL
+
+class BidLedger:
+    def __init__(self, project_ids: Iterable[Any] = None,
+                 reconcile_interval: int = BID_LEDGER_RECONCILE_INTERVAL):
+        self._project_ids: Set[str] = {str(project_id) for project_id in (project_ids or [])}
+        self._lock = threading.Lock()
+        self.reconcile_interval = reconcile_interval
+        self.last_reconciled_at: Optional[float] = None
+
+    def has_bid(self, project_id: Any) -> bool:
+        """
+        Check whether we have bid on a project.
+        """
+        return str(project_id) in self._project_ids
+
+    def record(self, project_id: Any) -> None:
+        """
+        Record a bid we just placed.
+        """
+        with self._lock:
+            self._project_ids.add(str(project_id))
+
+    def merge(self, project_ids: Iterable[Any]) -> int:
+        """
+        Merge project IDs found on the server and mark the ledger reconciled.
+        Returns the number of projects that were missing locally.
+        """
+        new_ids = {str(project_id) for project_id in project_ids}
+        with self._lock:
+            missing = len(new_ids - self._project_ids)
+            self._project_ids |= new_ids
+            self.last_reconciled_at = time.monotonic()
+        return missing
+
+    def needs_reconciliation(self) -> bool:
+        """
+        Check whether the periodic reconciliation with the bids API is due.
+        """
+        if self.last_reconciled_at is None:
+            return True
+        return time.monotonic() - self.last_reconciled_at >= self.reconcile_interval
+
+    def __len__(self) -> int:
+        return len(self._project_ids)
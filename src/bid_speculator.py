@@ -0,0 +1,146 @@
+"""
+Speculative bid writing and pricing overlapped with the LLM match check
+"""
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Optional
+
+from langchain_core.callbacks import get_usage_metadata_callback
+
+class BidSpeculator:
+    """
+    Starts bid writing and pricing for likely matches while their match
+    check is still running, so a MATCH verdict finds the bid ready.
+
+    On NO MATCH the work is cancelled if it has not started, otherwise its
+    result is discarded and its tokens are counted as waste. Time saved per
+    used bid is the overlap between the match check and the speculative
+    work: sequentially the two would take (match + prep), overlapped they
+    take max(match, prep), so the saving is min(match, prep).
+    """
+
+    def __init__(self, ai_service, max_workers: int):
+        self.ai_service = ai_service
+        # LLM calls made here share the AIService's concurrency cap with the match checks
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='speculative-bid')
+        self._pending: Dict[Any, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        self.started = 0
+        self.used = 0
+        self.cancelled = 0
+        self.discarded = 0
+        self.saved_seconds = 0.0
+        self.used_tokens = 0
+        self.wasted_tokens = 0
+
+    def _prepare(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """Write the bid and price the project, counting the tokens used"""
+        with get_usage_metadata_callback() as usage:
+            bid_content = self.ai_service.generate_bid_content(project)
+            budget_info = None
+            if bid_content and not project.get('duplicate_pricing'):
+                budget_info = self.ai_service.analyze_budget_deadline(project)
+        return {
+            'bid_content': bid_content,
+            'budget_info': budget_info,
+            'finished_at': time.monotonic(),
+            'tokens': sum(model_usage.get('total_tokens', 0) for model_usage in usage.usage_metadata.values())
+        }
+
+    def start(self, project: Dict[str, Any]) -> None:
+        """
+        Begin preparing a bid for a project whose match check is starting.
+        """
+        with self._lock:
+            if project.get('id') in self._pending:
+                return
+            self.started += 1
+            self._pending[project.get('id')] = {
+                'future': self.executor.submit(self._prepare, project),
+                'started_at': time.monotonic(),
+                'verdict_at': None
+            }
+
+    def resolve(self, project: Dict[str, Any], is_match: bool) -> None:
+        """
+        Record the match verdict; speculative work for a NO MATCH is dropped.
+        """
+        with self._lock:
+            entry = self._pending.get(project.get('id'))
+            if entry is None:
+                return
+            entry['verdict_at'] = time.monotonic()
+        if not is_match:
+            self.discard(project)
+
+    def discard(self, project: Dict[str, Any]) -> None:
+        """
+        Drop speculative work that will not be used.
+        """
+        with self._lock:
+            entry = self._pending.pop(project.get('id'), None)
+        if entry is None:
+            return
+
+        future: Future = entry['future']
+        if future.cancel():
+            with self._lock:
+                self.cancelled += 1
+            return
+
+        def count_waste(done: Future) -> None:
+            tokens = 0 if done.exception() else done.result()['tokens']
+            with self._lock:
+                self.discarded += 1
+                self.wasted_tokens += tokens
+        future.add_done_callback(count_waste)
+
+    def discard_all(self) -> None:
+        """
+        Drop all pending speculative work, e.g. for projects past the bid limit.
+        """
+        with self._lock:
+            pending = list(self._pending)
+        for project_id in pending:
+            self.discard({'id': project_id})
+
+    def take(self, project: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the speculative bid for a matched project, waiting for it if
+        still running. Returns None if there is none or it failed.
+        """
+        with self._lock:
+            entry = self._pending.pop(project.get('id'), None)
+        if entry is None:
+            return None
+
+        try:
+            result = entry['future'].result()
+        except Exception:
+            return None
+
+        verdict_at = entry['verdict_at'] or time.monotonic()
+        with self._lock:
+            self.used += 1
+            self.used_tokens += result['tokens']
+            self.saved_seconds += max(0.0, min(verdict_at, result['finished_at']) - entry['started_at'])
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get time-to-bid saved against tokens spent on discarded bids.
+        """
+        with self._lock:
+            return {
+                'started': self.started,
+                'used': self.used,
+                'cancelled': self.cancelled,
+                'discarded': self.discarded,
+                'hit_rate': round(self.used / self.started, 4) if self.started else 0.0,
+                'saved_seconds': round(self.saved_seconds, 2),
+                'avg_saved_seconds': round(self.saved_seconds / self.used, 3) if self.used else 0.0,
+                'used_tokens': self.used_tokens,
+                'wasted_tokens': self.wasted_tokens
+            }
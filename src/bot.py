@@ -3,13 +3,27 @@ Main Freelancer Bot class
 """
 import time
 import uuid
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from .config import BID_LIMIT, PROJECT_SEARCH_LIMIT
+from .config import (
+    BID_LIMIT, PROJECT_SEARCH_LIMIT, MIN_WAIT_TIME, BOT_POLL_INTERVAL, MATCH_PREFILTER_ENABLED,
+    MATCH_CLASSIFIER_ENABLED, SERVICE_OFFERINGS, AI_MAX_CONCURRENCY, AI_MATCH_BATCH_SIZE, AI_SPECULATIVE_BIDS,
+    LLM_CACHE_ENABLED, DUPLICATE_INDEX_ENABLED, DUPLICATE_ACTION
+)
 from .freelancer_service import FreelancerService
 from .ai_service import AIService
+from .config_manager import config_manager
 from .database import DatabaseService
+from .llm_cache import LLMCache, fingerprint
+from .bid_ledger import BidLedger
+from .project_poller import IncrementalProjectPoller
+from .match_prefilter import MatchPrefilter, LIKELY
+from .match_classifier import load_classifier
+from .duplicate_index import DuplicateIndex
+from .bid_speculator import BidSpeculator
 from .utils import extract_budget_and_deadline, calculate_bid_amount, validate_project_data
 
 class FreelancerBot:
@@ -17,7 +31,7 @@ class FreelancerBot:
                  project_search_limit: int = None, min_wait_time: int = None,
                  skill_ids: List[int] = None, language_codes: List[str] = None,
                  unwanted_currencies: List[str] = None, unwanted_countries: List[str] = None,
-                 config_manager_instance=None):
+                 config_manager_instance=None, project_poller=None):
         self.session_id = session_id or str(uuid.uuid4())
         self.processed_project_ids = set()
         self.bid_counter = 0
@@ -26,7 +40,9 @@ class FreelancerBot:
         # Use session-specific parameters or fall back to defaults
         self.bid_limit = bid_limit or BID_LIMIT
         self.project_search_limit = project_search_limit or PROJECT_SEARCH_LIMIT
-        self.min_wait_time = min_wait_time or 32
+        self.min_wait_time = min_wait_time if min_wait_time is not None else MIN_WAIT_TIME
+        self.poll_interval = BOT_POLL_INTERVAL
+        self.ai_concurrency = max(1, AI_MAX_CONCURRENCY)
         
         # Set session-specific filtering parameters
         if skill_ids:
@@ -54,14 +70,33 @@ class FreelancerBot:
             self.unwanted_countries = list(UNWANTED_COUNTRIES)
         
         # Create services with session-specific parameters
+        self.database = DatabaseService()
         self.freelancer_service = FreelancerService(
             skill_ids=self.skill_ids,
             language_codes=self.language_codes,
             unwanted_currencies=self.unwanted_currencies,
-            unwanted_countries=self.unwanted_countries
+            unwanted_countries=self.unwanted_countries,
+            bid_ledger=BidLedger(self.database.get_bid_project_ids(self.session_id)),
+            oauth_token=config_manager_instance.get_oauth_token() if config_manager_instance else None
+        )
+        self.ai_service = AIService(
+            config_manager_instance=config_manager_instance,
+            llm_cache=LLMCache(self.database) if LLM_CACHE_ENABLED else None,
+            max_concurrency=self.ai_concurrency
+        )
+        self.config_manager = config_manager_instance or config_manager
+        self.match_prefilter = None
+        self.match_classifier = None
+        self.duplicate_index = None
+        
+        # Optionally overlap bid writing with the match check of likely projects
+        self.bid_speculator = BidSpeculator(self.ai_service, self.ai_concurrency) if AI_SPECULATIVE_BIDS else None
+        
+        # Use a shared feed subscription if given, otherwise poll on our own
+        self.project_poller = project_poller or IncrementalProjectPoller(
+            self.freelancer_service.search_projects,
+            page_size=self.project_search_limit
         )
-        self.ai_service = AIService(config_manager_instance=config_manager_instance)
-        self.database = DatabaseService()
         
         # Create or get existing bot session
         self.bot_session = self.database.create_bot_session(
@@ -87,6 +122,18 @@ class FreelancerBot:
         self.is_running = True
         self.bid_counter = 0
         self.processed_project_ids.clear()
+        self.project_poller.reset()
+        
+        # Retrain the local match classifier from this session's verdict history
+        if MATCH_CLASSIFIER_ENABLED:
+            service_offerings = self.config_manager.get_service_offerings() or SERVICE_OFFERINGS
+            self.match_classifier = load_classifier(self.database, self.session_id, service_offerings)
+            if self.match_classifier:
+                self.database.log_bot_activity(
+                    self.session_id,
+                    "INFO",
+                    f"Loaded match classifier trained on {self.match_classifier.metadata.get('samples', 0)} verdicts"
+                )
         
         # Update bid limit if provided
         if bid_limit:
@@ -116,6 +163,7 @@ class FreelancerBot:
             return {"error": str(e)}
         finally:
             self.stop()
+            self.freelancer_service.close()
     
     def stop(self) -> Dict[str, Any]:
         """
@@ -146,23 +194,18 @@ class FreelancerBot:
         """
         Main bot execution loop.
         """
-        offset = 0
-        
         while self.bid_counter < self.bid_limit and self.is_running:
             try:
-                # Search for projects
-                projects = self.freelancer_service.search_projects(
-                    limit=self.project_search_limit, 
-                    offset=offset
-                )
+                # Search for projects posted or updated since the last poll
+                projects = self.project_poller.poll()
                 
                 if not projects:
                     self.database.log_bot_activity(
                         self.session_id,
-                        "WARNING",
-                        "No projects found"
+                        "INFO",
+                        "No new projects found"
                     )
-                    time.sleep(5)
+                    time.sleep(self.poll_interval)
                     continue
                 
                 self.database.log_bot_activity(
@@ -177,14 +220,19 @@ class FreelancerBot:
                     total_projects_found=self.bot_session.total_projects_found + len(projects)
                 )
                 
-                # Filter out already processed projects
-                new_projects = [
-                    p for p in projects 
-                    if p.get('id') not in self.processed_project_ids
-                ]
+                if getattr(self.project_poller, 'last_poll_had_gap', False):
+                    self.database.log_bot_activity(
+                        self.session_id,
+                        "WARNING",
+                        "Poll reached the page limit before earlier projects; some new projects were skipped"
+                    )
                 
-                for p in new_projects:
-                    self.processed_project_ids.add(p.get('id'))
+                # Filter out already processed projects, and repeats within this poll
+                new_projects = []
+                for p in projects:
+                    if p.get('id') not in self.processed_project_ids:
+                        self.processed_project_ids.add(p.get('id'))
+                        new_projects.append(p)
                 
                 self.database.log_bot_activity(
                     self.session_id,
@@ -193,7 +241,7 @@ class FreelancerBot:
                 )
                 
                 if not new_projects:
-                    time.sleep(5)
+                    time.sleep(self.poll_interval)
                     continue
                 
                 # Filter projects
@@ -212,7 +260,7 @@ class FreelancerBot:
                 )
                 
                 if not filtered_projects:
-                    time.sleep(5)
+                    time.sleep(self.poll_interval)
                     continue
                 
                 # Refine projects with AI
@@ -225,7 +273,7 @@ class FreelancerBot:
                 )
                 
                 if not refined_projects:
-                    time.sleep(5)
+                    time.sleep(self.poll_interval)
                     continue
                 
                 # Generate and place bids
@@ -239,7 +287,7 @@ class FreelancerBot:
                     )
                     break
                 
-                time.sleep(5)
+                time.sleep(self.poll_interval)
                 
             except Exception as e:
                 self.database.log_bot_activity(
@@ -251,7 +299,7 @@ class FreelancerBot:
                     self.session_id,
                     total_errors=self.bot_session.total_errors + 1
                 )
-                time.sleep(5)
+                time.sleep(self.poll_interval)
         
         return {
             "status": "completed",
@@ -261,131 +309,409 @@ class FreelancerBot:
     
     def _refine_projects_with_ai(self, projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Refine projects using AI analysis.
+        Refine projects using AI analysis. Projects are evaluated concurrently
+        up to the AI concurrency cap; results are handled in input order.
         """
         refined = []
         
-        for project in projects:
-            try:
-                # Validate project data
-                if not validate_project_data(project):
+        # Validate project data
+        projects = [project for project in projects if validate_project_data(project)]
+        
+        # Near-duplicates of judged projects reuse the earlier verdict instead of the LLM
+        duplicate_index = self._get_duplicate_index()
+        duplicates = [duplicate_index.query(project) if duplicate_index else None for project in projects]
+        
+        with ThreadPoolExecutor(max_workers=self.ai_concurrency) as executor:
+            checks = iter(self._submit_match_checks(
+                executor, [project for project, duplicate in zip(projects, duplicates) if not duplicate]
+            ))
+            futures = [None if duplicate else next(checks) for duplicate in duplicates]
+            
+            for project, duplicate, future in zip(projects, duplicates, futures):
+                if duplicate:
+                    if self._use_duplicate(project, duplicate):
+                        refined.append(project)
                     continue
                 
-                # Check if project matches our services
-                result = self.ai_service.check_project_match(project)
-                
-                if result.lower() == "match":
-                    refined.append(project)
+                try:
+                    # Check if project matches our services
+                    result, source = future.result()
+                    if duplicate_index:
+                        duplicate_index.add(project, result.upper())
+                    is_match = result.lower() == "match"
+                    if is_match:
+                        refined.append(project)
+                    
+                    if source == "llm":
+                        # LLM verdicts keep the project text as training data for the match classifier
+                        message = "matched our services" if is_match else "did not match our services"
+                        additional_data = {
+                            "project_title": project.get("project_title"),
+                            "project_description": project.get("project_description"),
+                            "offerings_hash": fingerprint(
+                                self.config_manager.get_service_offerings() or SERVICE_OFFERINGS
+                            )
+                        }
+                    else:
+                        message = f"{'matched' if is_match else 'rejected'} by local {source}"
+                        additional_data = None
+                    
                     self.database.log_bot_activity(
                         self.session_id,
                         "INFO",
-                        f"Project {project.get('id')} matched our services",
-                        project_id=project.get('id')
+                        f"Project {project.get('id')} {message}",
+                        project_id=project.get('id'),
+                        additional_data=additional_data
                     )
-                else:
+                        
+                except Exception as e:
+                    if self.bid_speculator:
+                        self.bid_speculator.discard(project)
                     self.database.log_bot_activity(
                         self.session_id,
-                        "INFO",
-                        f"Project {project.get('id')} did not match our services",
+                        "ERROR",
+                        f"AI evaluation failed for project {project.get('id')}: {str(e)}",
                         project_id=project.get('id')
                     )
-                    
-            except Exception as e:
-                self.database.log_bot_activity(
-                    self.session_id,
-                    "ERROR",
-                    f"AI evaluation failed for project {project.get('id')}: {str(e)}",
-                    project_id=project.get('id')
-                )
         
         return refined
     
-    def _process_bids(self, projects: List[Dict[str, Any]]) -> None:
+    def _get_duplicate_index(self) -> Optional[DuplicateIndex]:
+        """
+        Get the near-duplicate index, reloaded when the service offerings
+        change since earlier verdicts no longer apply.
+        """
+        if not DUPLICATE_INDEX_ENABLED:
+            return None
+        
+        offerings_hash = fingerprint(self.config_manager.get_service_offerings() or SERVICE_OFFERINGS)
+        if self.duplicate_index is None or self.duplicate_index.offerings_hash != offerings_hash:
+            self.duplicate_index = DuplicateIndex(self.database, offerings_hash)
+            self.duplicate_index.load()
+        return self.duplicate_index
+    
+    def _use_duplicate(self, project: Dict[str, Any], duplicate: Dict[str, Any]) -> bool:
+        """
+        Handle a near-duplicate project. Returns True if it should be bid on
+        with the earlier project's verdict and pricing.
+        """
+        reuse = DUPLICATE_ACTION == 'reuse' and duplicate['verdict'] == 'MATCH'
+        if reuse and duplicate['budget'] is not None:
+            project['duplicate_pricing'] = (duplicate['budget'], duplicate['deadline'])
+        
+        if DUPLICATE_ACTION == 'skip':
+            outcome = "skipped"
+        else:
+            outcome = "matched" if reuse else "rejected"
+        self.database.log_bot_activity(
+            self.session_id,
+            "INFO",
+            f"Project {project.get('id')} {outcome} as near-duplicate of project "
+            f"{duplicate['project_id']} (similarity {duplicate['similarity']})",
+            project_id=project.get('id')
+        )
+        return reuse
+    
+    def _get_match_prefilter(self) -> Optional[MatchPrefilter]:
         """
-        Process projects and place bids.
+        Get the local pre-classifier, rebuilt when the service offerings change.
         """
+        if not MATCH_PREFILTER_ENABLED:
+            return None
+        
+        service_offerings = self.config_manager.get_service_offerings() or SERVICE_OFFERINGS
+        if self.match_prefilter is None or self.match_prefilter.service_offerings != service_offerings:
+            self.match_prefilter = MatchPrefilter(service_offerings)
+        return self.match_prefilter
+    
+    def _submit_match_checks(self, executor: ThreadPoolExecutor, projects: List[Dict[str, Any]]) -> List[Future]:
+        """
+        Start match checks for projects, returning a future of (verdict, source)
+        per project. With AI_MATCH_BATCH_SIZE above 1, projects that need the
+        LLM are checked in batches sharing one prompt.
+        """
+        if AI_MATCH_BATCH_SIZE <= 1 or self.ai_service.combined_analysis:
+            return [executor.submit(self._check_project_match, project) for project in projects]
+        
+        futures = []
+        batch = []
         for project in projects:
-            if not self.is_running or self.bid_counter >= self.bid_limit:
-                break
+            future = Future()
+            futures.append(future)
+            local, prediction = self._check_project_match_locally(project)
+            if local:
+                future.set_result(local)
+                continue
             
+            batch.append((project, prediction, future))
+            if len(batch) == AI_MATCH_BATCH_SIZE:
+                executor.submit(self._check_match_batch, batch)
+                batch = []
+        if batch:
+            executor.submit(self._check_match_batch, batch)
+        return futures
+    
+    def _check_project_match(self, project: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Get the match verdict and where it came from. Clear mismatches are
+        rejected by the local pre-classifier, and confident predictions of
+        the self-trained classifier skip the LLM.
+        """
+        local, prediction = self._check_project_match_locally(project)
+        if local:
+            return local
+        
+        # Write the bid of a likely match while the LLM decides
+        speculated = self._start_speculative_bid(project, prediction)
+        try:
+            verdict = self._check_project_match_with_llm(project)
+        except Exception:
+            if speculated:
+                self.bid_speculator.discard(project)
+            raise
+        
+        self._record_llm_verdict(project, prediction, verdict, speculated)
+        return verdict, "llm"
+    
+    def _check_match_batch(self, batch: List[Tuple[Dict[str, Any], Optional[str], Future]]) -> None:
+        """
+        Check a batch of projects with one LLM call and resolve their futures.
+        Projects the batch gives no verdict for are checked one by one.
+        """
+        try:
+            self._resolve_match_batch(batch)
+        except Exception as e:
+            # Callers wait on these futures, so none may be left unresolved
+            for project, _, future in batch:
+                if not future.done():
+                    if self.bid_speculator:
+                        self.bid_speculator.discard(project)
+                    future.set_exception(e)
+    
+    def _resolve_match_batch(self, batch: List[Tuple[Dict[str, Any], Optional[str], Future]]) -> None:
+        """Run a batched match check and set each project's (verdict, source) future"""
+        projects = [project for project, _, _ in batch]
+        speculated = [self._start_speculative_bid(project, prediction) for project, prediction, _ in batch]
+        try:
+            verdicts = self.ai_service.check_projects_match(projects)
+        except Exception as e:
+            self.database.log_bot_activity(
+                self.session_id,
+                "WARNING",
+                f"Batched match check failed for {len(projects)} projects, checking them one by one: {str(e)}"
+            )
+            verdicts = [None] * len(projects)
+        
+        for (project, prediction, future), verdict, was_speculated in zip(batch, verdicts, speculated):
             try:
-                # Save project to database
-                self.database.save_project(project)
-                
-                # Generate bid content
-                bid_content = self.ai_service.generate_bid_content(project)
-                if not bid_content:
-                    continue
-                
+                if verdict is None:
+                    verdict = self._check_project_match_with_llm(project)
+                self._record_llm_verdict(project, prediction, verdict, was_speculated)
+                future.set_result((verdict, "llm"))
+            except Exception as e:
+                if was_speculated:
+                    self.bid_speculator.discard(project)
+                future.set_exception(e)
+    
+    def _check_project_match_locally(self, project: Dict[str, Any]) -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
+        """
+        Get a (verdict, source) from the local pre-classifier or classifier
+        if either is confident, and the pre-classifier prediction.
+        """
+        prefilter = self._get_match_prefilter()
+        prediction = None
+        if prefilter is not None:
+            prediction = prefilter.classify(project)
+            if not prefilter.should_forward(prediction):
+                return ("NO MATCH", "pre-classifier"), prediction
+        
+        if self.match_classifier is not None:
+            verdict = self.match_classifier.classify(project)
+            if verdict is not None:
+                return (verdict, "classifier"), prediction
+        
+        return None, prediction
+    
+    def _start_speculative_bid(self, project: Dict[str, Any], prediction: Optional[str]) -> bool:
+        """Start writing the bid of a likely match before its LLM verdict"""
+        if self.bid_speculator is None or prediction != LIKELY or self.ai_service.combined_analysis:
+            return False
+        self.bid_speculator.start(project)
+        return True
+    
+    def _record_llm_verdict(self, project: Dict[str, Any], prediction: Optional[str], verdict: str,
+                            speculated: bool) -> None:
+        """Settle speculative work and pre-classifier agreement for an LLM verdict"""
+        if speculated:
+            self.bid_speculator.resolve(project, verdict.lower() == "match")
+        if prediction is not None:
+            self.match_prefilter.record_verdict(prediction, verdict)
+    
+    def _check_project_match_with_llm(self, project: Dict[str, Any]) -> str:
+        """
+        Get the LLM match verdict, keeping the combined analysis on the project
+        for bidding when combined mode is on and its response validated.
+        """
+        if self.ai_service.combined_analysis:
+            analysis = self.ai_service.analyze_project(project)
+            if analysis is not None:
+                project['ai_analysis'] = analysis
+                return analysis['verdict']
+            
+            self.database.log_bot_activity(
+                self.session_id,
+                "WARNING",
+                f"Combined analysis invalid for project {project.get('id')}, using separate calls",
+                project_id=project.get('id')
+            )
+        
+        return self.ai_service.check_project_match(project)
+    
+    def _prepare_bid(self, project: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Generate bid content, amount and period for a project.
+        Returns None if no bid content was generated.
+        """
+        analysis = project.get('ai_analysis')
+        if analysis:
+            # Combined analysis already produced the bid, budget and deadline
+            bid_content = analysis['bid_content']
+            budget, deadline = analysis['budget'], analysis['deadline']
+        else:
+            # Use the bid written during the match check, if any
+            speculative = self.bid_speculator.take(project) if self.bid_speculator else None
+            
+            # Generate bid content
+            bid_content = speculative['bid_content'] if speculative else self.ai_service.generate_bid_content(project)
+            if not bid_content:
+                return None
+            
+            if project.get('duplicate_pricing'):
+                # Reuse the pricing of the project this one duplicates
+                budget, deadline = project['duplicate_pricing']
+            else:
                 # Analyze budget and deadline
-                budget_deadline_info = self.ai_service.analyze_budget_deadline(project)
+                if speculative and speculative['budget_info'] is not None:
+                    budget_deadline_info = speculative['budget_info']
+                else:
+                    budget_deadline_info = self.ai_service.analyze_budget_deadline(project)
                 budget, deadline = extract_budget_and_deadline(budget_deadline_info)
+        
+        if self.duplicate_index and not project.get('duplicate_pricing'):
+            self.duplicate_index.set_pricing(project, budget, deadline)
+        
+        # Calculate bid amount
+        bid_amount = calculate_bid_amount(project, budget)
+        
+        # Set default deadline if not provided
+        if deadline is None:
+            deadline = 7 if project.get('type', '').lower() == 'fixed' else 40
+        
+        # Compose final bid
+        final_bid_content = self.ai_service.compose_bid_template(bid_content)
+        
+        # Prepare bid data
+        return {
+            "project_id": project["id"],
+            "project_title": project["project_title"],
+            "project_description": project["project_description"],
+            "bid_content": final_bid_content,
+            "bid_amount": bid_amount,
+            "bid_period": deadline,
+            "currency_code": project["currency"],
+            "project_link": f"https://www.freelancer.com/projects/{project.get('seo_url', project['id'])}/details",
+            "session_id": self.session_id
+        }
+    
+    def _process_bids(self, projects: List[Dict[str, Any]]) -> None:
+        """
+        Process projects and place bids. Bids are prepared concurrently up to
+        the AI concurrency cap but submitted one at a time in project order.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.ai_concurrency)
+        remaining = iter(projects)
+        preparing = deque()
+        try:
+            while True:
+                # Don't spend LLM calls on bids past the limit: prepare one bid
+                # per slot left, and start the next project whenever one ends without a bid
+                while len(preparing) < self.bid_limit - self.bid_counter:
+                    project = next(remaining, None)
+                    if project is None:
+                        break
+                    preparing.append((project, executor.submit(self._prepare_bid, project)))
                 
-                # Calculate bid amount
-                bid_amount = calculate_bid_amount(project, budget)
-                
-                # Set default deadline if not provided
-                if deadline is None:
-                    deadline = 7 if project.get('type', '').lower() == 'fixed' else 40
-                
-                # Compose final bid
-                final_bid_content = self.ai_service.compose_bid_template(bid_content)
-                
-                # Prepare bid data
-                bid_data = {
-                    "project_id": project["id"],
-                    "project_title": project["project_title"],
-                    "project_description": project["project_description"],
-                    "bid_content": final_bid_content,
-                    "bid_amount": bid_amount,
-                    "bid_period": deadline,
-                    "currency_code": project["currency"],
-                    "project_link": f"https://www.freelancer.com/projects/{project.get('seo_url', project['id'])}/details",
-                    "session_id": self.session_id
-                }
-                
-                # Place bid
-                success = self.freelancer_service.process_project_bid(
-                    project, final_bid_content, bid_amount, deadline
-                )
+                if not preparing or not self.is_running or self.bid_counter >= self.bid_limit:
+                    break
+                project, future = preparing.popleft()
                 
-                if success:
-                    self.bid_counter += 1
+                try:
+                    # Save project to database
+                    self.database.save_project(project)
                     
-                    # Save bid to database
-                    self.database.save_bid(bid_data)
+                    bid_data = future.result()
+                    if not bid_data:
+                        continue
                     
-                    # Log to Excel
-                    self.database.log_bid_to_excel(bid_data)
+                    # Guard against bidding twice if a project slipped through more than once
+                    if self.freelancer_service.bid_ledger.has_bid(project['id']):
+                        self.database.log_bot_activity(
+                            self.session_id,
+                            "WARNING",
+                            f"Skipped duplicate bid on project {project['id']}",
+                            project_id=project['id']
+                        )
+                        continue
                     
-                    # Update session stats
-                    self.database.update_bot_session(
-                        self.session_id,
-                        total_bids_placed=self.bid_counter
+                    # Place bid
+                    success = self.freelancer_service.process_project_bid(
+                        project, bid_data["bid_content"], bid_data["bid_amount"], bid_data["bid_period"],
+                        min_wait=self.min_wait_time
                     )
                     
-                    self.database.log_bot_activity(
-                        self.session_id,
-                        "INFO",
-                        f"Successfully placed bid on project {project['id']}",
-                        project_id=project['id'],
-                        additional_data={"bid_amount": bid_amount, "bid_period": deadline}
-                    )
-                else:
+                    if success:
+                        self.bid_counter += 1
+                        
+                        # Save bid to database
+                        self.database.save_bid(bid_data)
+                        
+                        # Log to Excel
+                        self.database.log_bid_to_excel(bid_data)
+                        
+                        # Update session stats
+                        self.database.update_bot_session(
+                            self.session_id,
+                            total_bids_placed=self.bid_counter
+                        )
+                        
+                        self.database.log_bot_activity(
+                            self.session_id,
+                            "INFO",
+                            f"Successfully placed bid on project {project['id']}",
+                            project_id=project['id'],
+                            additional_data={"bid_amount": bid_data["bid_amount"], "bid_period": bid_data["bid_period"]}
+                        )
+                    else:
+                        self.database.log_bot_activity(
+                            self.session_id,
+                            "ERROR",
+                            f"Failed to place bid on project {project['id']}",
+                            project_id=project['id']
+                        )
+                    
+                except Exception as e:
                     self.database.log_bot_activity(
                         self.session_id,
                         "ERROR",
-                        f"Failed to place bid on project {project['id']}",
-                        project_id=project['id']
+                        f"Error processing bid for project {project.get('id')}: {str(e)}",
+                        project_id=project.get('id')
                     )
-                
-            except Exception as e:
-                self.database.log_bot_activity(
-                    self.session_id,
-                    "ERROR",
-                    f"Error processing bid for project {project.get('id')}: {str(e)}",
-                    project_id=project.get('id')
-                )
+        finally:
+            # Drop preparations that haven't started if we stopped early
+            executor.shutdown(wait=False, cancel_futures=True)
+            # Speculative bids left over were for projects past the bid limit
+            if self.bid_speculator:
+                self.bid_speculator.discard_all()
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -395,7 +721,19 @@ class FreelancerBot:
             "is_running": self.is_running,
             "bid_counter": self.bid_counter,
             "session_id": self.session_id,
-            "processed_projects": len(self.processed_project_ids)
+            "processed_projects": len(self.processed_project_ids),
+            "owner_cache": self.freelancer_service.owner_cache.get_stats(),
+            "filter_chain": self.freelancer_service.get_filter_stats(),
+            "rate_limiter": self.freelancer_service.rate_limiter.get_stats(),
+            "ai_analysis": self.ai_service.get_analysis_stats(),
+            "llm_cache": self.ai_service.get_cache_stats(),
+            "pricing": self.ai_service.get_pricing_stats(),
+            "generation": self.ai_service.get_generation_stats(),
+            "llm_pool": self.ai_service.get_llm_pool_stats(),
+            "speculative_bids": self.bid_speculator.get_stats() if self.bid_speculator else None,
+            "match_prefilter": self.match_prefilter.get_stats() if self.match_prefilter else None,
+            "match_classifier": self.match_classifier.get_stats() if self.match_classifier else None,
+            "duplicate_index": self.duplicate_index.get_stats() if self.duplicate_index else None
         }
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -7,14 +7,105 @@ from typing import List, Set
 # API Configuration
 OAUTH_TOKEN = os.getenv('FREELANCER_OAUTH_TOKEN', '')
 GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')
+GROQ_API_BASE = os.getenv('GROQ_API_BASE', '')
+GROQ_MODEL = os.getenv('GROQ_MODEL', 'qwen/qwen3-32b')
+
+# Per-stage models (sessions can override them); a small fast model suits the match check and pricing
+GROQ_MATCH_MODEL = os.getenv('GROQ_MATCH_MODEL', GROQ_MODEL)
+GROQ_BUDGET_MODEL = os.getenv('GROQ_BUDGET_MODEL', GROQ_MODEL)
+GROQ_BID_MODEL = os.getenv('GROQ_BID_MODEL', GROQ_MODEL)
+
+# LLM provider pool: extra keys shared by all sessions and models to fall back to (comma-separated)
+GROQ_API_KEYS = [key.strip() for key in os.getenv('GROQ_API_KEYS', '').split(',') if key.strip()]
+GROQ_FALLBACK_MODELS = [model.strip() for model in os.getenv('GROQ_FALLBACK_MODELS', '').split(',') if model.strip()]
+LLM_POOL_MAX_WAIT = float(os.getenv('LLM_POOL_MAX_WAIT', '60'))
 
 # Bot Configuration
 BID_LIMIT = int(os.getenv('BID_LIMIT', '75'))
 PROJECT_SEARCH_LIMIT = int(os.getenv('PROJECT_SEARCH_LIMIT', '10'))
+PROJECT_POLL_MAX_PAGES = int(os.getenv('PROJECT_POLL_MAX_PAGES', '5'))
+
+# Shared project feed for multi-session runs (poll interval in seconds)
+SHARED_PROJECT_FEED = os.getenv('SHARED_PROJECT_FEED', 'true').lower() == 'true'
+PROJECT_FEED_POLL_INTERVAL = float(os.getenv('PROJECT_FEED_POLL_INTERVAL', '5'))
+PROJECT_FEED_QUEUE_SIZE = int(os.getenv('PROJECT_FEED_QUEUE_SIZE', '500'))
 MIN_WAIT_TIME = int(os.getenv('MIN_WAIT_TIME', '32'))
+BOT_POLL_INTERVAL = float(os.getenv('BOT_POLL_INTERVAL', '5'))
 RETRY_COUNT = int(os.getenv('RETRY_COUNT', '3'))
 RETRY_WAIT_SECONDS = int(os.getenv('RETRY_WAIT_SECONDS', '5'))
 
+# Freelancer API client
+FREELANCER_API_URL = os.getenv('FREELANCER_API_URL', 'https://www.freelancer.com')
+FREELANCER_MAX_CONCURRENCY = int(os.getenv('FREELANCER_MAX_CONCURRENCY', '8'))
+FREELANCER_REQUEST_TIMEOUT = float(os.getenv('FREELANCER_REQUEST_TIMEOUT', '30'))
+
+# Freelancer API rate limiting per OAuth token (the reserve is kept for bid placement)
+FREELANCER_RATE_LIMIT_PER_SECOND = float(os.getenv('FREELANCER_RATE_LIMIT_PER_SECOND', '2'))
+FREELANCER_RATE_LIMIT_BURST = int(os.getenv('FREELANCER_RATE_LIMIT_BURST', '10'))
+FREELANCER_RATE_LIMIT_BID_RESERVE = int(os.getenv('FREELANCER_RATE_LIMIT_BID_RESERVE', '2'))
+FREELANCER_MAX_429_RETRIES = int(os.getenv('FREELANCER_MAX_429_RETRIES', '3'))
+FREELANCER_DEFAULT_RETRY_AFTER = float(os.getenv('FREELANCER_DEFAULT_RETRY_AFTER', '5'))
+
+# Freelancer API batching
+PROJECT_DETAILS_BATCH_SIZE = int(os.getenv('PROJECT_DETAILS_BATCH_SIZE', '50'))
+
+# Project owner cache (TTLs in seconds)
+OWNER_CACHE_MAX_SIZE = int(os.getenv('OWNER_CACHE_MAX_SIZE', '5000'))
+OWNER_CACHE_TTL = int(os.getenv('OWNER_CACHE_TTL', '21600'))
+OWNER_CACHE_NEGATIVE_TTL = int(os.getenv('OWNER_CACHE_NEGATIVE_TTL', '600'))
+
+# Bid ledger reconciliation with the bids API (interval in seconds)
+BID_LEDGER_RECONCILE_INTERVAL = int(os.getenv('BID_LEDGER_RECONCILE_INTERVAL', '1800'))
+BID_LEDGER_RECONCILE_LIMIT = int(os.getenv('BID_LEDGER_RECONCILE_LIMIT', '100'))
+
+# Project filter chain (evaluations before a predicate is reordered by its stats)
+FILTER_CHAIN_MIN_SAMPLES = int(os.getenv('FILTER_CHAIN_MIN_SAMPLES', '20'))
+
+# AI analysis (combined mode asks for verdict, budget, deadline and bid in one JSON call)
+AI_COMBINED_ANALYSIS = os.getenv('AI_COMBINED_ANALYSIS', 'false').lower() == 'true'
+AI_MAX_CONCURRENCY = int(os.getenv('AI_MAX_CONCURRENCY', '4'))
+# Projects per batched LLM match check (1 checks each project on its own) and description length sent per project
+AI_MATCH_BATCH_SIZE = int(os.getenv('AI_MATCH_BATCH_SIZE', '1'))
+AI_MATCH_BATCH_DESCRIPTION_CHARS = int(os.getenv('AI_MATCH_BATCH_DESCRIPTION_CHARS', '600'))
+# Write bids for projects the pre-classifier rates likely while their match check runs
+AI_SPECULATIVE_BIDS = os.getenv('AI_SPECULATIVE_BIDS', 'false').lower() == 'true'
+
+# Generation profiles (reasoning effort 'none' turns off Qwen3 <think> output; empty sends no reasoning setting or token caps)
+AI_REASONING_EFFORT = os.getenv('AI_REASONING_EFFORT', 'none')
+AI_REASONING_MODELS = [m.strip() for m in os.getenv('AI_REASONING_MODELS', 'qwen/qwen3-32b').split(',') if m.strip()]
+AI_MATCH_MAX_TOKENS = int(os.getenv('AI_MATCH_MAX_TOKENS', '8'))
+AI_BUDGET_MAX_TOKENS = int(os.getenv('AI_BUDGET_MAX_TOKENS', '32'))
+AI_BID_MAX_TOKENS = int(os.getenv('AI_BID_MAX_TOKENS', '400'))
+AI_ANALYSIS_MAX_TOKENS = int(os.getenv('AI_ANALYSIS_MAX_TOKENS', '700'))
+
+# Persistent LLM response cache for match checks and budget analysis (TTL in seconds)
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', '604800'))
+LLM_CACHE_MAX_SIZE = int(os.getenv('LLM_CACHE_MAX_SIZE', '20000'))
+
+# Local match pre-classifier (score = positive - negative offerings terms; audit rate forwards a sample of rejections)
+MATCH_PREFILTER_ENABLED = os.getenv('MATCH_PREFILTER_ENABLED', 'true').lower() == 'true'
+MATCH_PREFILTER_REJECT_SCORE = int(os.getenv('MATCH_PREFILTER_REJECT_SCORE', '-1'))
+MATCH_PREFILTER_LIKELY_SCORE = int(os.getenv('MATCH_PREFILTER_LIKELY_SCORE', '2'))
+MATCH_PREFILTER_AUDIT_RATE = float(os.getenv('MATCH_PREFILTER_AUDIT_RATE', '0.05'))
+
+# Self-trained match classifier (the LLM is only called below the confidence threshold)
+MATCH_CLASSIFIER_ENABLED = os.getenv('MATCH_CLASSIFIER_ENABLED', 'false').lower() == 'true'
+MATCH_CLASSIFIER_THRESHOLD = float(os.getenv('MATCH_CLASSIFIER_THRESHOLD', '0.9'))
+MATCH_CLASSIFIER_MIN_SAMPLES = int(os.getenv('MATCH_CLASSIFIER_MIN_SAMPLES', '200'))
+MATCH_CLASSIFIER_DIR = os.getenv('MATCH_CLASSIFIER_DIR', 'models')
+
+# Near-duplicate project index (reuse: take the earlier verdict and pricing, skip: drop the project; TTL in seconds)
+DUPLICATE_INDEX_ENABLED = os.getenv('DUPLICATE_INDEX_ENABLED', 'true').lower() == 'true'
+DUPLICATE_SIMILARITY_THRESHOLD = float(os.getenv('DUPLICATE_SIMILARITY_THRESHOLD', '0.75'))
+DUPLICATE_ACTION = os.getenv('DUPLICATE_ACTION', 'reuse')
+DUPLICATE_INDEX_MAX_SIZE = int(os.getenv('DUPLICATE_INDEX_MAX_SIZE', '20000'))
+DUPLICATE_INDEX_TTL = int(os.getenv('DUPLICATE_INDEX_TTL', '604800'))
+
+# Local pricing engine (uplift rate: share of a client maximum above the base budget added to the bid)
+PRICING_ENGINE_ENABLED = os.getenv('PRICING_ENGINE_ENABLED', 'true').lower() == 'true'
+PRICING_UPLIFT_RATE = float(os.getenv('PRICING_UPLIFT_RATE', '0.25'))
+
 # Skill IDs for project filtering
 SKILL_IDS = [
     3, 9, 13, 15, 17, 20, 21, 26, 32, 38, 44, 57, 69, 70, 77, 106, 107, 115, 116, 127, 137, 168, 170, 174, 196, 197, 204, 229, 232, 234, 247, 250, 262, 264, 277, 278, 284, 305, 310, 323, 324, 335, 359, 365, 368, 369, 371, 375, 408, 412, 433, 436, 444, 445, 482, 502, 564, 624, 662, 710, 759, 878, 950, 953, 959, 1063, 1185, 1314, 1623, 2071, 2128, 2222, 2245, 2338, 2342, 2507, 2586, 2587, 2589, 2605, 2625, 2645, 2673, 2698, 2717, 2745
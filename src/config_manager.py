@@ -10,6 +10,8 @@ class ConfigManager:
     def __init__(self, config_file: str = "user_config.json"):
         self.config_file = Path(config_file)
         self.config = self.load_config()
+        # Bumped on every change so users of the values can tell when to rebuild
+        self.version = 0
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -39,10 +41,12 @@ class ConfigManager:
     def set(self, key: str, value: Any) -> None:
         """Set configuration value"""
         self.config[key] = value
+        self.version += 1
     
     def update(self, updates: Dict[str, Any]) -> None:
         """Update multiple configuration values"""
         self.config.update(updates)
+        self.version += 1
     
     def get_oauth_token(self) -> Optional[str]:
         """Get OAuth token"""
@@ -68,6 +72,10 @@ class ConfigManager:
         """Get signature"""
         return self.get('signature', '')
     
+    def get_stage_model(self, stage: str) -> str:
+        """Get the model for an AI stage ('match', 'budget' or 'bid')"""
+        return self.get(f'{stage}_model', '')
+    
     def update_api_keys(self, oauth_token: str = None, groq_api_key: str = None) -> None:
         """Update API keys"""
         if oauth_token:
@@ -89,6 +97,17 @@ class ConfigManager:
             self.set('signature', signature)
         self.save_config(self.config)
     
+    def update_model_config(self, match_model: str = None, budget_model: str = None,
+                            bid_model: str = None) -> None:
+        """Update per-stage models"""
+        if match_model is not None:
+            self.set('match_model', match_model)
+        if budget_model is not None:
+            self.set('budget_model', budget_model)
+        if bid_model is not None:
+            self.set('bid_model', bid_model)
+        self.save_config(self.config)
+    
     def get_all_config(self) -> Dict[str, Any]:
         """Get all configuration"""
         return self.config.copy()
@@ -96,6 +115,7 @@ class ConfigManager:
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults"""
         self.config = {}
+        self.version += 1
         self.save_config(self.config)
 
 # Global config manager instance
@@ -6,7 +6,7 @@ import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session as DBSession
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 
 from .config import DATABASE_URL
@@ -182,6 +182,59 @@ class DatabaseService:
         finally:
             db.close()
     
+    def get_bid_project_ids(self, session_id: str = None) -> Set[str]:
+        """Get IDs of projects we have bid on, optionally for one session"""
+        db = self.get_session()
+        try:
+            query = db.query(Bid.project_id)
+            if session_id:
+                query = query.filter(Bid.session_id == session_id)
+            return {str(row.project_id) for row in query.all() if row.project_id is not None}
+        finally:
+            db.close()
+    
+    def get_match_verdicts(self, session_id: str = None, offerings_hash: str = None) -> List[Dict[str, Any]]:
+        """
+        Get LLM match verdicts logged by the bot with the project text,
+        latest verdict per project. Text comes from the log entry or,
+        for older entries, from the saved project. With offerings_hash,
+        only verdicts made under those service offerings are returned.
+        """
+        db = self.get_session()
+        try:
+            query = db.query(BotLog).filter(
+                BotLog.project_id.isnot(None),
+                (BotLog.message.like('%matched our services')) | (BotLog.message.like('%did not match our services'))
+            )
+            if session_id:
+                query = query.filter(BotLog.session_id == session_id)
+            
+            verdicts: Dict[str, Dict[str, Any]] = {}
+            for log in query.order_by(BotLog.id).all():
+                data = log.additional_data or {}
+                if offerings_hash and data.get('offerings_hash') != offerings_hash:
+                    continue
+                verdicts[str(log.project_id)] = {
+                    'project_id': str(log.project_id),
+                    'session_id': log.session_id,
+                    'verdict': 'MATCH' if log.message.endswith('matched our services') else 'NO MATCH',
+                    'project_title': data.get('project_title'),
+                    'project_description': data.get('project_description'),
+                    'offerings_hash': data.get('offerings_hash'),
+                    'timestamp': log.timestamp.isoformat() if log.timestamp else None
+                }
+            
+            missing = [pid for pid, verdict in verdicts.items() if not verdict['project_title']]
+            if missing:
+                for project in db.query(Project).filter(Project.project_id.in_(missing)).all():
+                    verdict = verdicts[str(project.project_id)]
+                    verdict['project_title'] = project.project_title
+                    verdict['project_description'] = project.project_description
+            
+            return [verdict for verdict in verdicts.values() if verdict['project_title']]
+        finally:
+            db.close()
+    
     def get_recent_bids(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent bids"""
         db = self.get_session()
@@ -0,0 +1,281 @@
+"""
+Near-duplicate project index using MinHash LSH
+"""
+import json
+import zlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from .config import DUPLICATE_SIMILARITY_THRESHOLD, DUPLICATE_INDEX_MAX_SIZE, DUPLICATE_INDEX_TTL
+from .models import ProjectFingerprint
+from .match_prefilter import TOKEN_PATTERN, STOPWORDS, stem
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS = NUM_PERMUTATIONS // BANDS
+
+# Prune expired and evicted fingerprints every N writes
+PRUNE_EVERY = 50
+
+# Universal hash parameters for the MinHash permutations (fixed so persisted signatures stay valid)
+MERSENNE_PRIME = (1 << 61) - 1
+_PERMUTATIONS = [
+    (zlib.crc32(f"a{i}".encode()) * 2654435761 % MERSENNE_PRIME or 1,
+     zlib.crc32(f"b{i}".encode()) * 40503 % MERSENNE_PRIME)
+    for i in range(NUM_PERMUTATIONS)
+]
+
+def shingles(title: str, description: str) -> set:
+    """
+    Stemmed word unigrams and bigrams of a project's title and description,
+    ignoring stopwords so small rewordings keep most shingles.
+    """
+    words = [stem(token) for token in TOKEN_PATTERN.findall(f"{title or ''} {description or ''}".lower())]
+    words = [word for word in words if word not in STOPWORDS]
+    grams = set(words)
+    grams.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+    return grams
+
+def minhash(grams: set) -> Tuple[int, ...]:
+    """
+    MinHash signature of a shingle set.
+    """
+    if not grams:
+        return tuple([MERSENNE_PRIME] * NUM_PERMUTATIONS)
+    hashes = [zlib.crc32(gram.encode('utf-8')) for gram in grams]
+    return tuple(
+        min((a * value + b) % MERSENNE_PRIME for value in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """
+    Estimated Jaccard similarity of two signatures.
+    """
+    return sum(1 for x, y in zip(first, second) if x == y) / NUM_PERMUTATIONS
+
+class DuplicateIndex:
+    """
+    Remembers the verdict and pricing of recently judged projects so
+    near-duplicates (reposts, templated requests) can reuse them.
+
+    Signatures are split into LSH bands; projects sharing a band are
+    candidates, confirmed by estimated Jaccard similarity against the
+    threshold. Entries live in memory and in the project_fingerprints table
+    so the index survives restarts; only entries made under the current
+    service offerings are loaded.
+    """
+
+    def __init__(self, database=None, offerings_hash: str = '',
+                 threshold: float = DUPLICATE_SIMILARITY_THRESHOLD,
+                 max_size: int = DUPLICATE_INDEX_MAX_SIZE, ttl_seconds: int = DUPLICATE_INDEX_TTL):
+        self.database = database
+        self.offerings_hash = offerings_hash
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._bands: Dict[Tuple[int, Tuple[int, ...]], set] = {}
+        self._lock = threading.Lock()
+
+        self._writes = 0
+
+        self.queries = 0
+        self.hits = 0
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(band, signature[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+
+    def _insert(self, project_id: str, entry: Dict[str, Any]) -> None:
+        """Add an entry to memory, evicting the oldest beyond the max size (lock held)"""
+        if project_id in self._entries:
+            self._remove(project_id)
+        self._entries[project_id] = entry
+        for key in self._band_keys(entry['signature']):
+            self._bands.setdefault(key, set()).add(project_id)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, project_id: str) -> None:
+        entry = self._entries.pop(project_id)
+        for key in self._band_keys(entry['signature']):
+            members = self._bands.get(key)
+            if members:
+                members.discard(project_id)
+                if not members:
+                    del self._bands[key]
+
+    def load(self) -> int:
+        """
+        Load recent persisted entries for the current offerings. Returns the count loaded.
+        """
+        if self.database is None:
+            return 0
+
+        self.prune()
+        db = self.database.get_session()
+        try:
+            cutoff = datetime.now() - timedelta(seconds=self.ttl_seconds)
+            rows = (
+                db.query(ProjectFingerprint)
+                .filter(ProjectFingerprint.offerings_hash == self.offerings_hash,
+                        ProjectFingerprint.created_at >= cutoff)
+                .order_by(ProjectFingerprint.id.desc())
+                .limit(self.max_size)
+                .all()
+            )
+            with self._lock:
+                for row in reversed(rows):
+                    self._insert(row.project_id, {
+                        'project_id': row.project_id,
+                        'signature': tuple(json.loads(row.signature)),
+                        'verdict': row.verdict,
+                        'budget': row.budget,
+                        'deadline': row.deadline
+                    })
+            return len(rows)
+        finally:
+            db.close()
+
+    def query(self, project: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Find the most similar indexed project at or above the threshold.
+        Returns its entry with a 'similarity' key, or None.
+        """
+        project_id = str(project.get('id'))
+        signature = minhash(shingles(project.get('project_title'), project.get('project_description')))
+        project['minhash'] = signature
+
+        with self._lock:
+            self.queries += 1
+            candidates = set()
+            for key in self._band_keys(signature):
+                candidates |= self._bands.get(key, set())
+            candidates.discard(project_id)
+
+            best, best_similarity = None, 0.0
+            for candidate_id in candidates:
+                entry = self._entries[candidate_id]
+                score = similarity(signature, entry['signature'])
+                if score >= self.threshold and score > best_similarity:
+                    best, best_similarity = entry, score
+
+            if best is None:
+                return None
+            self.hits += 1
+            return dict(best, similarity=round(best_similarity, 3))
+
+    def add(self, project: Dict[str, Any], verdict: str) -> None:
+        """
+        Index a judged project and persist it.
+        """
+        project_id = str(project.get('id'))
+        signature = project.get('minhash') or minhash(
+            shingles(project.get('project_title'), project.get('project_description'))
+        )
+        with self._lock:
+            self._insert(project_id, {
+                'project_id': project_id, 'signature': signature, 'verdict': verdict, 'budget': None, 'deadline': None
+            })
+
+        if self.database is None:
+            return
+        db = self.database.get_session()
+        try:
+            db.add(ProjectFingerprint(
+                project_id=project_id,
+                offerings_hash=self.offerings_hash,
+                signature=json.dumps(list(signature)),
+                verdict=verdict
+            ))
+            db.commit()
+        except SQLAlchemyError as e:
+            print(f"Error saving project fingerprint: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete expired fingerprints, and those of the current offerings that
+        the in-memory index has evicted (the oldest beyond the max size).
+        Returns the number of rows deleted.
+        """
+        if self.database is None:
+            return 0
+
+        db = self.database.get_session()
+        try:
+            cutoff = datetime.now() - timedelta(seconds=self.ttl_seconds)
+            deleted = db.query(ProjectFingerprint).filter(
+                ProjectFingerprint.created_at < cutoff
+            ).delete(synchronize_session=False)
+
+            current = db.query(ProjectFingerprint).filter(ProjectFingerprint.offerings_hash == self.offerings_hash)
+            excess = current.count() - self.max_size
+            if excess > 0:
+                evicted_ids = [
+                    row.id for row in current.with_entities(ProjectFingerprint.id)
+                    .order_by(ProjectFingerprint.id.asc()).limit(excess).all()
+                ]
+                deleted += db.query(ProjectFingerprint).filter(
+                    ProjectFingerprint.id.in_(evicted_ids)
+                ).delete(synchronize_session=False)
+
+            db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            print(f"Error pruning project fingerprints: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
+
+    def set_pricing(self, project: Dict[str, Any], budget: Optional[int], deadline: Optional[int]) -> None:
+        """
+        Record the budget and deadline chosen for an indexed project.
+        """
+        project_id = str(project.get('id'))
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                return
+            entry['budget'], entry['deadline'] = budget, deadline
+
+        if self.database is None:
+            return
+        db = self.database.get_session()
+        try:
+            db.query(ProjectFingerprint).filter(
+                ProjectFingerprint.project_id == project_id,
+                ProjectFingerprint.offerings_hash == self.offerings_hash
+            ).update({'budget': budget, 'deadline': deadline}, synchronize_session=False)
+            db.commit()
+        except SQLAlchemyError as e:
+            print(f"Error saving project pricing: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index size and near-duplicate hit rate.
+        """
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'queries': self.queries,
+                'hits': self.hits,
+                'hit_rate': round(self.hits / self.queries, 4) if self.queries else 0.0
+            }
@@ -0,0 +1,110 @@
+"""
+Cost-ordered, self-tuning chain of project filter predicates
+"""
+import time
+import inspect
+from typing import Callable, List, Dict, Any
+
+from .config import FILTER_CHAIN_MIN_SAMPLES
+
+# Predicate cost tiers
+COST_LOCAL = 0        # Search result fields and in-memory state only
+COST_DETAILS = 1      # Needs the batched get_projects response
+COST_NETWORK = 2      # May make its own API call
+
+class FilterPredicate:
+    """
+    A named project check. check(context) returns True to keep the project;
+    it may be a plain function or a coroutine function.
+    """
+
+    def __init__(self, name: str, check: Callable[[Dict[str, Any]], Any], cost: int = COST_LOCAL):
+        self.name = name
+        self.check = check
+        self.cost = cost
+        self.is_async = inspect.iscoroutinefunction(check)
+
+        self.evaluated = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejected / self.evaluated if self.evaluated else 0.0
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.total_seconds / self.evaluated if self.evaluated else 0.0
+
+    def record(self, kept: bool, seconds: float) -> None:
+        """Record one evaluation"""
+        self.evaluated += 1
+        self.total_seconds += seconds
+        if not kept:
+            self.rejected += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'cost': self.cost,
+            'evaluated': self.evaluated,
+            'rejected': self.rejected,
+            'rejection_rate': round(self.rejection_rate, 4),
+            'avg_latency_ms': round(self.avg_seconds * 1000, 4)
+        }
+
+class FilterChain:
+    """
+    Runs predicates tier by tier, cheapest tier first. Within a tier,
+    predicates are ordered by measured seconds per rejection so the checks
+    that reject the most for the least time run first. Predicates with
+    fewer than min_samples evaluations are run first to gather stats.
+    """
+
+    def __init__(self, predicates: List[FilterPredicate] = None,
+                 min_samples: int = FILTER_CHAIN_MIN_SAMPLES):
+        self.predicates: List[FilterPredicate] = list(predicates or [])
+        self.min_samples = min_samples
+
+    def add_predicate(self, predicate: FilterPredicate) -> None:
+        """
+        Add a predicate to the chain.
+        """
+        self.predicates.append(predicate)
+
+    def _score(self, predicate: FilterPredicate) -> float:
+        """Seconds spent per rejection; lower runs earlier"""
+        if predicate.evaluated < self.min_samples:
+            return -1.0
+        return predicate.avg_seconds / max(predicate.rejection_rate, 0.001)
+
+    def ordered(self, cost: int) -> List[FilterPredicate]:
+        """
+        Get the predicates of one cost tier in their current run order.
+        """
+        tier = [predicate for predicate in self.predicates if predicate.cost == cost]
+        return sorted(tier, key=self._score)
+
+    async def evaluate(self, context: Dict[str, Any], cost: int) -> bool:
+        """
+        Run one cost tier against a project context, stopping at the first rejection.
+        """
+        for predicate in self.ordered(cost):
+            start = time.perf_counter()
+            if predicate.is_async:
+                kept = bool(await predicate.check(context))
+            else:
+                kept = bool(predicate.check(context))
+            predicate.record(kept, time.perf_counter() - start)
+
+            if not kept:
+                context['rejected_by'] = predicate.name
+                return False
+        return True
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-predicate stats in current run order.
+        """
+        tiers = sorted({predicate.cost for predicate in self.predicates})
+        return [predicate.get_stats() for cost in tiers for predicate in self.ordered(cost)]
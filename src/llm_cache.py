@@ -0,0 +1,157 @@
+"""
+Persistent LLM response cache keyed by prompt fingerprint
+"""
+import re
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from .config import LLM_CACHE_TTL, LLM_CACHE_MAX_SIZE
+from .models import LLMCacheEntry
+
+# Bump when a cached prompt changes so old responses are not reused
+PROMPT_VERSION = 1
+
+# Prune expired and least recently used entries every N writes
+PRUNE_EVERY = 50
+
+def normalize_text(text: Any) -> str:
+    """Collapse whitespace and case so trivially different reposts share a key"""
+    return re.sub(r"\s+", " ", str(text or "")).strip().lower()
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Stable hash of prompt inputs, e.g. the service offerings a verdict was
+    made under. The one offerings hash used by the cache, the verdict log,
+    the match classifier and the duplicate index.
+    """
+    payload = json.dumps([normalize_text(part) if isinstance(part, str) else part for part in parts],
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class LLMCache:
+    """
+    Stores LLM responses in the bot database so reposted projects and
+    projects seen again after a restart skip the LLM call. Entries expire
+    after the TTL; the least recently used are dropped beyond the max size.
+    """
+
+    def __init__(self, database, ttl_seconds: int = LLM_CACHE_TTL, max_size: int = LLM_CACHE_MAX_SIZE):
+        self.database = database
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def make_key(self, kind: str, version: str, **inputs: Any) -> str:
+        """
+        Build a cache key from the call kind, a version fingerprint and prompt inputs.
+        """
+        return fingerprint(kind, PROMPT_VERSION, version, inputs)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response, or None on a miss or expired entry.
+        """
+        db = self.database.get_session()
+        try:
+            entry = db.query(LLMCacheEntry).filter(LLMCacheEntry.cache_key == key).first()
+            now = datetime.now()
+            if entry and entry.created_at and entry.created_at < now - timedelta(seconds=self.ttl_seconds):
+                db.delete(entry)
+                db.commit()
+                entry = None
+
+            if entry is None:
+                with self._lock:
+                    self.misses += 1
+                return None
+
+            entry.hits = (entry.hits or 0) + 1
+            entry.last_used_at = now
+            db.commit()
+            with self._lock:
+                self.hits += 1
+                self.saved_seconds += entry.llm_seconds or 0.0
+            return entry.response
+        except SQLAlchemyError as e:
+            print(f"Error reading LLM cache: {e}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+    def put(self, key: str, kind: str, response: str, llm_seconds: float) -> None:
+        """
+        Store a response with the time its LLM call took.
+        """
+        db = self.database.get_session()
+        try:
+            db.add(LLMCacheEntry(
+                cache_key=key,
+                kind=kind,
+                response=response,
+                llm_seconds=llm_seconds,
+                created_at=datetime.now(),
+                last_used_at=datetime.now()
+            ))
+            db.commit()
+        except SQLAlchemyError:
+            # Another thread stored the same key first
+            db.rollback()
+        finally:
+            db.close()
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete expired entries and the least recently used beyond the max size.
+        Returns the number of entries deleted.
+        """
+        db = self.database.get_session()
+        try:
+            cutoff = datetime.now() - timedelta(seconds=self.ttl_seconds)
+            deleted = db.query(LLMCacheEntry).filter(LLMCacheEntry.created_at < cutoff).delete(synchronize_session=False)
+
+            excess = db.query(LLMCacheEntry).count() - self.max_size
+            if excess > 0:
+                stale_ids = [
+                    row.id for row in db.query(LLMCacheEntry.id)
+                    .order_by(LLMCacheEntry.last_used_at.asc()).limit(excess).all()
+                ]
+                deleted += db.query(LLMCacheEntry).filter(LLMCacheEntry.id.in_(stale_ids)).delete(synchronize_session=False)
+
+            db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            print(f"Error pruning LLM cache: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit rate and LLM seconds saved since startup.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'saved_seconds': round(self.saved_seconds, 2)
+            }
@@ -0,0 +1,299 @@
+"""
+Pool of Groq API keys and models with headroom-based routing and 429 failover
+"""
+import time
+import threading
+from typing import Callable, List, Dict, Any, Optional, Tuple
+
+import httpx
+from groq import RateLimitError, DefaultHttpxClient
+from langchain_groq import ChatGroq
+
+from .config import GROQ_API_BASE, GROQ_MODEL, LLM_POOL_MAX_WAIT
+
+# Cooldown after a 429 without a Retry-After header (seconds)
+DEFAULT_COOLDOWN = 5.0
+
+# Compiled prompt | model chains kept per provider; prompts are rebuilt only on config changes
+MAX_CHAINS = 256
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse Groq reset durations such as '7.66s', '2m59.56s' or '120ms' into seconds.
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    seconds, number = 0.0, ''
+    index = 0
+    while index < len(value):
+        char = value[index]
+        if char.isdigit() or char == '.':
+            number += char
+        elif value.startswith('ms', index):
+            seconds += float(number or 0) / 1000
+            number = ''
+            index += 1
+        elif char in 'hms':
+            seconds += float(number or 0) * {'h': 3600, 'm': 60, 's': 1}[char]
+            number = ''
+        else:
+            return None
+        index += 1
+    return seconds
+
+class LLMProvider:
+    """
+    One API key and model. Rate-limit headroom is read from the
+    x-ratelimit-* headers of every response through an httpx hook.
+    """
+
+    def __init__(self, api_key: str, model: str, base_url: Optional[str] = None):
+        self.api_key = api_key
+        self.model = model
+        self.label = f"...{api_key[-4:]}/{model}" if api_key else f"default/{model}"
+        # The pool fails over on 429s, so the client must not retry them itself
+        self.llm = ChatGroq(
+            api_key=api_key, model_name=model, base_url=base_url or None, max_retries=0,
+            http_client=DefaultHttpxClient(event_hooks={'response': [self._record_headers]})
+        )
+        self._lock = threading.Lock()
+        self._chains: Dict[Tuple[int, Tuple], Tuple[Any, Any]] = {}
+
+        self.limit_tokens = 0
+        self.remaining_tokens = None
+        self.limit_requests = 0
+        self.remaining_requests = None
+        self.reset_at = 0.0
+        self.cooldown_until = 0.0
+
+        self.calls = 0
+        self.rate_limited = 0
+        self.errors = 0
+
+    def _record_headers(self, response: httpx.Response) -> None:
+        headers = response.headers
+        with self._lock:
+            if 'x-ratelimit-remaining-tokens' in headers:
+                self.remaining_tokens = int(float(headers['x-ratelimit-remaining-tokens']))
+                self.limit_tokens = int(float(headers.get('x-ratelimit-limit-tokens', 0))) or self.limit_tokens
+            if 'x-ratelimit-remaining-requests' in headers:
+                self.remaining_requests = int(float(headers['x-ratelimit-remaining-requests']))
+                self.limit_requests = int(float(headers.get('x-ratelimit-limit-requests', 0))) or self.limit_requests
+            reset = parse_reset(headers.get('x-ratelimit-reset-tokens'))
+            if reset is not None:
+                self.reset_at = time.monotonic() + reset
+
+    def chain(self, prompt, kwargs: Dict[str, Any]):
+        """
+        Get the prompt | model chain for a prompt and generation settings,
+        built on first use.
+        """
+        key = (id(prompt), tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                                        for name, value in kwargs.items())))
+        with self._lock:
+            entry = self._chains.get(key)
+            # Entries hold their prompt, so its id is not reused while cached
+            if entry is None:
+                if len(self._chains) >= MAX_CHAINS:
+                    self._chains.clear()
+                entry = (prompt, prompt | self.llm.bind(**kwargs))
+                self._chains[key] = entry
+            return entry[1]
+
+    def headroom(self, now: float) -> float:
+        """
+        Fraction of the rate limit left, 1.0 when unknown or past its reset.
+        """
+        with self._lock:
+            if now < self.cooldown_until:
+                return 0.0
+            if now >= self.reset_at:
+                return 1.0
+            fractions = [
+                remaining / limit
+                for remaining, limit in ((self.remaining_tokens, self.limit_tokens),
+                                         (self.remaining_requests, self.limit_requests))
+                if remaining is not None and limit
+            ]
+            return min(fractions) if fractions else 1.0
+
+    def available_in(self, now: float) -> float:
+        """
+        Seconds until the provider can take calls again, 0 if it can now.
+        """
+        if self.headroom(now) > 0:
+            return 0.0
+        with self._lock:
+            return max(0.0, max(self.cooldown_until, self.reset_at) - now)
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            if success:
+                self.calls += 1
+            else:
+                self.errors += 1
+
+    def penalize(self, retry_after: float) -> None:
+        """
+        Take the provider out of rotation after a 429.
+        """
+        with self._lock:
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + retry_after)
+            self.remaining_tokens = 0
+            self.rate_limited += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        headroom = self.headroom(now)
+        with self._lock:
+            return {
+                'provider': self.label,
+                'calls': self.calls,
+                'rate_limited': self.rate_limited,
+                'errors': self.errors,
+                'headroom': round(headroom, 3),
+                'cooldown_seconds': round(max(0.0, self.cooldown_until - now), 2)
+            }
+
+class LLMPool:
+    """
+    Routes each call to the provider with the most rate-limit headroom.
+
+    Providers serving the requested model are preferred, round robin among
+    equally healthy ones; other models are only used when all of them are
+    cooling down. A 429 puts the provider in cooldown for its Retry-After
+    and the call moves to the next provider immediately. When every
+    provider is cooling, the call waits for the first one to recover, up
+    to max_wait seconds.
+    """
+
+    def __init__(self, providers: List[LLMProvider], max_wait: float = LLM_POOL_MAX_WAIT):
+        self.providers = providers
+        self.default_model = providers[0].model
+        self.max_wait = max_wait
+        self._next = 0
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.failovers = 0
+        self.model_fallbacks = 0
+        self.waited_seconds = 0.0
+
+    def _choose(self, model: str, exclude: set) -> Optional[LLMProvider]:
+        """Pick the healthiest provider not yet tried, preferring the requested model"""
+        now = time.monotonic()
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.providers)
+
+        ordered = self.providers[start:] + self.providers[:start]
+        available = [(p, p.headroom(now)) for p in ordered if id(p) not in exclude]
+        for preferred in (True, False):
+            candidates = [(p, h) for p, h in available if h > 0 and (p.model == model) == preferred]
+            if candidates:
+                if not preferred:
+                    with self._lock:
+                        self.model_fallbacks += 1
+                # max() keeps the first of equal candidates, so ties rotate
+                return max(candidates, key=lambda item: item[1])[0]
+        return None
+
+    def invoke(self, prompt, inputs: Dict[str, Any], model: Optional[str] = None,
+               settings: Optional[Callable[[str], Dict[str, Any]]] = None, **kwargs):
+        """
+        Run a prompt on the healthiest provider, failing over on 429s.
+        Other errors are raised for the caller's retry handling.
+
+        settings maps the model of the provider chosen to its generation
+        settings, so a call falling back to another model is not sent
+        settings meant for the requested one. The serving model is in the
+        response's response_metadata['model_name'].
+        """
+        model = model or self.default_model
+        with self._lock:
+            self.calls += 1
+
+        tried = set()
+        waited = 0.0
+        rate_limited = False
+        while True:
+            provider = self._choose(model, tried)
+            if provider and rate_limited:
+                rate_limited = False
+                with self._lock:
+                    self.failovers += 1
+            if provider is None:
+                now = time.monotonic()
+                wait = max(0.1, min(p.available_in(now) for p in self.providers))
+                if waited + wait > self.max_wait:
+                    raise RuntimeError(f"All {len(self.providers)} LLM providers are rate limited")
+                time.sleep(wait)
+                waited += wait
+                with self._lock:
+                    self.waited_seconds += wait
+                tried.clear()
+                rate_limited = False
+                continue
+
+            try:
+                bound = dict(kwargs, **settings(provider.model)) if settings else kwargs
+                response = provider.chain(prompt, bound).invoke(inputs)
+            except RateLimitError as e:
+                retry_after = parse_reset(e.response.headers.get('retry-after')) or DEFAULT_COOLDOWN
+                provider.penalize(retry_after)
+                tried.add(id(provider))
+                rate_limited = True
+                continue
+            except Exception:
+                provider.record(False)
+                raise
+
+            provider.record(True)
+            response.response_metadata.setdefault('model_name', provider.model)
+            return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get routing counters and per-provider health.
+        """
+        with self._lock:
+            stats = {
+                'calls': self.calls,
+                'failovers': self.failovers,
+                'model_fallbacks': self.model_fallbacks,
+                'waited_seconds': round(self.waited_seconds, 2)
+            }
+        stats['providers'] = [provider.get_stats() for provider in self.providers]
+        return stats
+
+_providers: Dict[Tuple[str, str, str], LLMProvider] = {}
+_pools: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], LLMPool] = {}
+_pools_lock = threading.Lock()
+
+def get_llm_pool(api_keys: List[str], models: List[str] = None, base_url: str = GROQ_API_BASE) -> LLMPool:
+    """
+    Get the pool for a set of keys and models. Providers are shared by
+    every pool using the same key and model, so sessions see each other's
+    rate-limit state.
+    """
+    keys = tuple(dict.fromkeys(key for key in api_keys if key)) or ('',)
+    models = tuple(dict.fromkeys(model for model in (models or [GROQ_MODEL]) if model))
+    with _pools_lock:
+        pool = _pools.get((keys, models))
+        if pool is None:
+            providers = []
+            for model in models:
+                for key in keys:
+                    provider = _providers.get((key, model, base_url))
+                    if provider is None:
+                        provider = LLMProvider(key, model, base_url)
+                        _providers[(key, model, base_url)] = provider
+                    providers.append(provider)
+            pool = LLMPool(providers)
+            _pools[(keys, models)] = pool
+        return pool
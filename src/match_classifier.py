@@ -0,0 +1,284 @@
+"""
+Self-trained local match classifier built from logged LLM verdicts.
+Export and training are run with train_match_classifier.py.
+"""
+import os
+import json
+import math
+import zlib
+import random
+import argparse
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+from .config import (
+    MATCH_CLASSIFIER_THRESHOLD, MATCH_CLASSIFIER_MIN_SAMPLES, MATCH_CLASSIFIER_DIR, SERVICE_OFFERINGS
+)
+from .match_prefilter import TOKEN_PATTERN, STOPWORDS, stem
+from .llm_cache import fingerprint
+
+FEATURE_BITS = 18
+
+def sigmoid(value: float) -> float:
+    if value < -35:
+        return 0.0
+    return 1.0 / (1.0 + math.exp(-value))
+
+def extract_features(title: str, description: str) -> Dict[int, float]:
+    """
+    Hashed unigram and bigram features; title terms get their own slots.
+    """
+    features: Dict[int, float] = {}
+
+    def add(feature: str) -> None:
+        index = zlib.crc32(feature.encode('utf-8')) & ((1 << FEATURE_BITS) - 1)
+        features[index] = 1.0
+
+    for prefix, text in (('t:', title), ('d:', description)):
+        terms = [stem(token) for token in TOKEN_PATTERN.findall((text or '').lower()) if len(token) > 1]
+        terms = [term for term in terms if term not in STOPWORDS]
+        for term in terms:
+            add(term)
+            if prefix == 't:':
+                add(prefix + term)
+        for first, second in zip(terms, terms[1:]):
+            add(f"{first} {second}")
+
+    # L2-normalise so long descriptions don't dominate
+    norm = math.sqrt(len(features)) or 1.0
+    return {index: value / norm for index, value in features.items()}
+
+class MatchClassifier:
+    """
+    Logistic regression over hashed text features, trained with SGD.
+    Weights are stored sparsely so models stay small and load fast.
+    """
+
+    def __init__(self, session_id: Optional[str] = None, offerings_hash: str = ''):
+        self.session_id = session_id
+        self.offerings_hash = offerings_hash
+        self.weights: Dict[int, float] = {}
+        self.bias = 0.0
+        self.metadata: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+        self.predictions = 0
+        self.confident = 0
+
+    def _raw_score(self, features: Dict[int, float]) -> float:
+        return self.bias + sum(self.weights.get(index, 0.0) * value for index, value in features.items())
+
+    def _fit(self, samples: List[Tuple[Dict[int, float], int]], epochs: int, learning_rate: float,
+             l2: float, seed: int) -> None:
+        """Run SGD with class weights balancing MATCH and NO MATCH"""
+        positives = sum(label for _, label in samples)
+        negatives = len(samples) - positives
+        class_weight = {
+            1: len(samples) / (2 * positives) if positives else 1.0,
+            0: len(samples) / (2 * negatives) if negatives else 1.0
+        }
+
+        rng = random.Random(seed)
+        order = list(range(len(samples)))
+        self.weights, self.bias = {}, 0.0
+        for epoch in range(epochs):
+            rng.shuffle(order)
+            rate = learning_rate / (1 + epoch)
+            for i in order:
+                features, label = samples[i]
+                error = (sigmoid(self._raw_score(features)) - label) * class_weight[label]
+                self.bias -= rate * error
+                for index, value in features.items():
+                    weight = self.weights.get(index, 0.0)
+                    self.weights[index] = weight - rate * (error * value + l2 * weight)
+
+    def train(self, verdicts: List[Dict[str, Any]], threshold: float = MATCH_CLASSIFIER_THRESHOLD,
+              epochs: int = 15, learning_rate: float = 0.5, l2: float = 1e-4, holdout: float = 0.2,
+              seed: int = 42) -> Dict[str, Any]:
+        """
+        Train on verdicts from DatabaseService.get_match_verdicts. A holdout
+        split measures accuracy and how many projects clear the threshold
+        before the final model is fit on all verdicts.
+        """
+        samples = [
+            (extract_features(v['project_title'], v.get('project_description')), 1 if v['verdict'] == 'MATCH' else 0)
+            for v in verdicts
+        ]
+        shuffled = list(samples)
+        random.Random(seed).shuffle(shuffled)
+        split = int(len(shuffled) * (1 - holdout))
+        train_set, test_set = shuffled[:split], shuffled[split:]
+
+        evaluation = {'holdout': len(test_set), 'accuracy': 0.0, 'coverage': 0.0, 'confident_accuracy': 0.0}
+        if train_set and test_set:
+            self._fit(train_set, epochs, learning_rate, l2, seed)
+            correct = confident = confident_correct = 0
+            for features, label in test_set:
+                probability = sigmoid(self._raw_score(features))
+                is_correct = (probability >= 0.5) == bool(label)
+                correct += is_correct
+                if max(probability, 1 - probability) >= threshold:
+                    confident += 1
+                    confident_correct += is_correct
+            evaluation.update({
+                'accuracy': round(correct / len(test_set), 4),
+                'coverage': round(confident / len(test_set), 4),
+                'confident_accuracy': round(confident_correct / confident, 4) if confident else 0.0
+            })
+
+        self._fit(samples, epochs, learning_rate, l2, seed)
+        self.metadata = {
+            'trained_at': datetime.now().isoformat(),
+            'samples': len(samples),
+            'matches': sum(label for _, label in samples),
+            'threshold': threshold,
+            'evaluation': evaluation
+        }
+        return self.metadata
+
+    def predict_proba(self, project: Dict[str, Any]) -> float:
+        """
+        Probability that a project is a MATCH.
+        """
+        features = extract_features(project.get('project_title'), project.get('project_description'))
+        return sigmoid(self._raw_score(features))
+
+    def classify(self, project: Dict[str, Any], threshold: float = MATCH_CLASSIFIER_THRESHOLD) -> Optional[str]:
+        """
+        Get 'MATCH' or 'NO MATCH' if confidence reaches the threshold, else None.
+        """
+        probability = self.predict_proba(project)
+        confident = max(probability, 1 - probability) >= threshold
+        with self._lock:
+            self.predictions += 1
+            self.confident += confident
+        if not confident:
+            return None
+        return 'MATCH' if probability >= 0.5 else 'NO MATCH'
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get training metadata and runtime coverage.
+        """
+        with self._lock:
+            return {
+                'session_id': self.session_id,
+                'samples': self.metadata.get('samples', 0),
+                'evaluation': self.metadata.get('evaluation'),
+                'predictions': self.predictions,
+                'confident': self.confident,
+                'llm_skip_rate': round(self.confident / self.predictions, 4) if self.predictions else 0.0
+            }
+
+    def save(self, path: str) -> None:
+        """
+        Save the model as JSON.
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'session_id': self.session_id,
+                'offerings_hash': self.offerings_hash,
+                'feature_bits': FEATURE_BITS,
+                'bias': self.bias,
+                'weights': {str(index): round(weight, 6) for index, weight in self.weights.items() if abs(weight) > 1e-6},
+                'metadata': self.metadata
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['MatchClassifier']:
+        """
+        Load a saved model, or None if it is missing or unreadable.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError):
+            return None
+
+        if data.get('feature_bits') != FEATURE_BITS:
+            return None
+
+        classifier = cls(data.get('session_id'), data.get('offerings_hash', ''))
+        classifier.bias = data.get('bias', 0.0)
+        classifier.weights = {int(index): weight for index, weight in data.get('weights', {}).items()}
+        classifier.metadata = data.get('metadata', {})
+        return classifier
+
+def model_path(session_id: Optional[str] = None) -> str:
+    """
+    Path of a session's model file, or of the model shared by all sessions.
+    """
+    name = f"match_classifier_{session_id}.json" if session_id else "match_classifier.json"
+    return os.path.join(MATCH_CLASSIFIER_DIR, name)
+
+def train_classifier(database, session_id: Optional[str], service_offerings: str,
+                     min_samples: int = MATCH_CLASSIFIER_MIN_SAMPLES) -> Optional[MatchClassifier]:
+    """
+    Train and save a classifier from a session's verdicts logged under the
+    given service offerings. Returns None if there are too few verdicts or
+    only one class.
+    """
+    offerings_hash = fingerprint(service_offerings)
+    verdicts = database.get_match_verdicts(session_id, offerings_hash)
+    matches = sum(1 for v in verdicts if v['verdict'] == 'MATCH')
+    if len(verdicts) < min_samples or matches in (0, len(verdicts)):
+        return None
+
+    classifier = MatchClassifier(session_id, offerings_hash)
+    classifier.train(verdicts)
+    classifier.save(model_path(session_id))
+    return classifier
+
+def load_classifier(database, session_id: Optional[str], service_offerings: str,
+                    retrain: bool = True) -> Optional[MatchClassifier]:
+    """
+    Get a classifier for a session: retrain from its history if possible,
+    otherwise load a saved session or shared model. Models trained under
+    different service offerings are ignored since their labels no longer apply.
+    """
+    if retrain:
+        classifier = train_classifier(database, session_id, service_offerings)
+        if classifier:
+            return classifier
+
+    offerings_hash = fingerprint(service_offerings)
+    for path in (model_path(session_id), model_path()):
+        classifier = MatchClassifier.load(path)
+        if classifier and classifier.offerings_hash == offerings_hash:
+            return classifier
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Export verdict history and train the local match classifier')
+    parser.add_argument('command', choices=['export', 'train'])
+    parser.add_argument('--session', default=None, help='Session ID (default: all sessions)')
+    parser.add_argument('--output', default='match_verdicts.jsonl', help='Export file')
+    parser.add_argument('--service-offerings-file', default=None,
+                        help='Offerings the verdicts were made under (default: SERVICE_OFFERINGS)')
+    parser.add_argument('--min-samples', type=int, default=MATCH_CLASSIFIER_MIN_SAMPLES)
+    args = parser.parse_args()
+
+    from .database import DatabaseService
+    database = DatabaseService()
+
+    if args.command == 'export':
+        verdicts = database.get_match_verdicts(args.session)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for verdict in verdicts:
+                f.write(json.dumps(verdict, ensure_ascii=False) + '\n')
+        print(f"Exported {len(verdicts)} verdicts to {args.output}")
+        return
+
+    service_offerings = SERVICE_OFFERINGS
+    if args.service_offerings_file:
+        with open(args.service_offerings_file, 'r', encoding='utf-8') as f:
+            service_offerings = f.read()
+
+    classifier = train_classifier(database, args.session, service_offerings, min_samples=args.min_samples)
+    if classifier is None:
+        print(f"Not enough verdicts to train (need {args.min_samples} with both MATCH and NO MATCH "
+              f"made under the given service offerings)")
+        return
+    print(f"Saved {model_path(args.session)}: {json.dumps(classifier.metadata)}")
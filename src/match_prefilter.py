@@ -0,0 +1,168 @@
+"""
+Local keyword pre-classifier that gates LLM project match checks
+"""
+import re
+import time
+import random
+import threading
+from typing import Set, Dict, Any, Tuple
+
+from .config import MATCH_PREFILTER_REJECT_SCORE, MATCH_PREFILTER_LIKELY_SCORE, MATCH_PREFILTER_AUDIT_RATE
+
+# Predictions
+REJECT = 'reject'
+BORDERLINE = 'borderline'
+LIKELY = 'likely'
+
+# Sentences in the service offerings that describe work we do not take
+NEGATIVE_MARKERS = ("do not", "don't", "does not", "not provide", "no match", "solely about", "not interested")
+
+STOPWORDS = {
+    'a', 'about', 'all', 'also', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been', 'but', 'by', 'can',
+    'client', 'consider', 'do', 'does', 'don', 'e', 'eg', 'etc', 'exclusively', 'for', 'from', 'g', 'have',
+    'if', 'in', 'include', 'is', 'it', 'its', 'just', 'looking', 'match', 'me', 'my', 'need', 'no', 'not',
+    'of', 'on', 'only', 'or', 'our', 'part', 'please', 'project', 'provide', 'require', 's', 'service',
+    'should', 'similar', 'so', 'solely', 'some', 'such', 'support', 'supported', 'that', 'the', 'their',
+    'them', 'these', 'they', 'this', 'those', 'to', 'type', 'us', 'use', 'using', 'want', 'we', 'which',
+    'who', 'will', 'with', 'work', 'would', 'you', 'your'
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-/][a-z0-9]+)*")
+
+def stem(word: str) -> str:
+    """
+    Strip common English suffixes so 'fixing' and 'fix' or 'banners' and
+    'banner' share a term.
+    """
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith(('sses', 'xes', 'ches', 'shes')):
+        return word[:-2]
+    if word.endswith('s') and not word.endswith('ss') and len(word) > 3:
+        return word[:-1]
+    for suffix in ('ing', 'ed'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in 'aeiouls':
+                word = word[:-1]
+            break
+    return word
+
+def extract_terms(text: str) -> Set[str]:
+    """
+    Get the set of stemmed, non-stopword terms in a text.
+    """
+    terms = {stem(token) for token in TOKEN_PATTERN.findall((text or '').lower()) if len(token) > 1}
+    return terms - STOPWORDS
+
+class MatchPrefilter:
+    """
+    Scores projects against vocabularies built from the service offerings.
+
+    Terms from sentences describing work we take are positive; terms that
+    only appear in sentences describing work we reject (e.g. "We do not
+    provide ... Laravel") are negative. A project is rejected locally only
+    when its negative terms outweigh its positive ones, so anything
+    borderline still goes to the LLM. A small sample of rejections is
+    forwarded anyway to measure agreement with the LLM.
+    """
+
+    def __init__(self, service_offerings: str, reject_score: int = MATCH_PREFILTER_REJECT_SCORE,
+                 likely_score: int = MATCH_PREFILTER_LIKELY_SCORE, audit_rate: float = MATCH_PREFILTER_AUDIT_RATE):
+        self.service_offerings = service_offerings
+        self.reject_score = reject_score
+        self.likely_score = likely_score
+        self.audit_rate = audit_rate
+        self.positive_terms, self.negative_terms = self._build_vocabularies(service_offerings)
+        self._lock = threading.Lock()
+
+        self.evaluated = 0
+        self.rejected = 0
+        self.forwarded = 0
+        self.audited = 0
+        self.agreements = 0
+        self.compared = 0
+        self.total_seconds = 0.0
+
+    @staticmethod
+    def _build_vocabularies(service_offerings: str) -> Tuple[Set[str], Set[str]]:
+        """Split offerings terms into positive and negative vocabularies"""
+        positive, negative = set(), set()
+        for sentence in re.split(r"[.\n]+", service_offerings or ''):
+            lowered = sentence.lower()
+            if any(marker in lowered for marker in NEGATIVE_MARKERS):
+                negative |= extract_terms(sentence)
+            else:
+                positive |= extract_terms(sentence)
+        return positive, negative - positive
+
+    def score(self, project: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        Count the distinct positive and negative terms in a project.
+        """
+        terms = extract_terms(f"{project.get('project_title', '')} {project.get('project_description', '')}")
+        return len(terms & self.positive_terms), len(terms & self.negative_terms)
+
+    def classify(self, project: Dict[str, Any]) -> str:
+        """
+        Predict REJECT, BORDERLINE or LIKELY for a project.
+        """
+        started = time.perf_counter()
+        positive, negative = self.score(project)
+        score = positive - negative
+
+        if negative and score <= self.reject_score:
+            prediction = REJECT
+        elif score >= self.likely_score:
+            prediction = LIKELY
+        else:
+            prediction = BORDERLINE
+
+        with self._lock:
+            self.evaluated += 1
+            self.total_seconds += time.perf_counter() - started
+        return prediction
+
+    def should_forward(self, prediction: str) -> bool:
+        """
+        Decide whether a prediction still needs the LLM; a sample of
+        rejections is forwarded to measure agreement.
+        """
+        with self._lock:
+            if prediction != REJECT:
+                self.forwarded += 1
+                return True
+            if self.audit_rate and random.random() < self.audit_rate:
+                self.forwarded += 1
+                self.audited += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_verdict(self, prediction: str, verdict: str) -> None:
+        """
+        Compare a confident prediction with the LLM verdict.
+        """
+        if prediction == BORDERLINE:
+            return
+        is_match = verdict.strip().lower() == 'match'
+        with self._lock:
+            self.compared += 1
+            if (prediction == LIKELY) == is_match:
+                self.agreements += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pass-through and agreement rates.
+        """
+        with self._lock:
+            return {
+                'evaluated': self.evaluated,
+                'rejected': self.rejected,
+                'forwarded': self.forwarded,
+                'audited': self.audited,
+                'pass_through_rate': round(self.forwarded / self.evaluated, 4) if self.evaluated else 0.0,
+                'agreement_rate': round(self.agreements / self.compared, 4) if self.compared else 0.0,
+                'compared': self.compared,
+                'avg_latency_us': round(self.total_seconds / self.evaluated * 1e6, 2) if self.evaluated else 0.0
+            }
@@ -70,3 +70,27 @@ class BotLog(Base):
     project_id = Column(String, nullable=True)
     additional_data = Column(JSON, nullable=True)
 
+
+class LLMCacheEntry(Base):
+    __tablename__ = "llm_cache"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String, unique=True, index=True)  # Fingerprint of prompt inputs and versions
+    kind = Column(String)  # match, budget
+    response = Column(Text)
+    llm_seconds = Column(Float)  # Time the LLM call took, saved on each hit
+    hits = Column(Integer, default=0)
+    created_at = Column(DateTime, default=func.now())
+    last_used_at = Column(DateTime, default=func.now(), index=True)
+
+class ProjectFingerprint(Base):
+    __tablename__ = "project_fingerprints"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(String, index=True)
+    offerings_hash = Column(String, index=True)  # Offerings the verdict was made under
+    signature = Column(Text)  # MinHash signature as JSON
+    verdict = Column(String)  # MATCH or NO MATCH
+    budget = Column(Integer, nullable=True)  # Recommended budget in USD
+    deadline = Column(Integer, nullable=True)  # Days
+    created_at = Column(DateTime, default=func.now(), index=True)
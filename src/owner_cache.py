@@ -0,0 +1,115 @@
+"""
+Process-wide cache of Freelancer project owner profiles
+"""
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterable
+
+from .config import OWNER_CACHE_MAX_SIZE, OWNER_CACHE_TTL, OWNER_CACHE_NEGATIVE_TTL
+
+class OwnerCache:
+    def __init__(self, max_size: int = OWNER_CACHE_MAX_SIZE, ttl_seconds: int = OWNER_CACHE_TTL,
+                 negative_ttl_seconds: int = OWNER_CACHE_NEGATIVE_TTL):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.rejections = 0
+
+    def get(self, owner_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached owner entry, or None if it is unknown or expired.
+        """
+        key = str(owner_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry['expires_at'] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put_user(self, owner_id: Any, user_details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cache country and reputation from a users API record.
+        """
+        country = ((user_details.get("location") or {}).get("country") or {}).get("name", "").lower()
+        reputation = user_details.get("employer_reputation") or user_details.get("reputation")
+        return self._put(owner_id, {
+            'found': True,
+            'country': country,
+            'reputation': reputation,
+        }, self.ttl_seconds)
+
+    def put_missing(self, owner_id: Any) -> Dict[str, Any]:
+        """
+        Remember that an owner does not exist, so it is not looked up on
+        every poll. Not for transient lookup failures.
+        """
+        return self._put(owner_id, {
+            'found': False,
+            'country': None,
+            'reputation': None,
+        }, self.negative_ttl_seconds)
+
+    def is_unwanted(self, entry: Optional[Dict[str, Any]], unwanted_countries: Iterable[str]) -> bool:
+        """
+        Check a cached entry against a session's unwanted countries.
+        """
+        if entry is None:
+            return False
+
+        if not entry['found'] or entry['country'] in unwanted_countries:
+            with self._lock:
+                self.rejections += 1
+            return True
+        return False
+
+    def _put(self, owner_id: Any, entry: Dict[str, Any], ttl_seconds: int) -> Dict[str, Any]:
+        """Store an entry and evict the least recently used ones over the size bound"""
+        key = str(owner_id)
+        entry['expires_at'] = time.monotonic() + ttl_seconds
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache size and hit/miss counters.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'rejections': self.rejections,
+                'hit_rate': (self.hits / lookups) if lookups else 0.0
+            }
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.rejections = 0
+
+# Global owner cache shared by every FreelancerService
+owner_cache = OwnerCache()
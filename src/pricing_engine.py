@@ -0,0 +1,143 @@
+"""
+Local pricing engine mapping projects onto the base project components
+"""
+import re
+import time
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+from .config import BASE_PROJECT_COMPONENTS, PRICING_UPLIFT_RATE
+
+# Phrases that identify each base component; components without an entry
+# are matched on their own name (e.g. 'brochure_design' -> 'brochure design')
+COMPONENT_KEYWORDS = {
+    "ecommerce_development": (
+        "ecommerce", "e-commerce", "online store", "online shop", "web shop", "webshop", "shopify",
+        "woocommerce", "bigcommerce", "magento"
+    ),
+    "website_design_development": (
+        "website", "web site", "landing page", "wordpress", "wix", "webflow", "squarespace", "godaddy",
+        "elementor", "web page", "webpage"
+    ),
+    "website_development_only": (
+        "figma to", "psd to", "xd to", "design to html", "design to wordpress", "from my design",
+        "design is ready", "designs are ready", "provided design", "existing design", "convert design"
+    ),
+    "ui_ux_design": (
+        "ui/ux", "ui ux", "ux", "user interface", "wireframe", "prototype", "app design", "dashboard design",
+        "figma design", "mockup"
+    ),
+    "logo_design": ("logo", "logotype", "brand mark"),
+    "custom_artwork": ("artwork", "painting", "drawing", "portrait", "sketch", "character design", "cartoon", "mascot"),
+    "vector_illustration": ("vector", "illustration", "illustrator", "infographic", "icon set")
+}
+
+# A project matching the key component also matches these, which it includes
+SUBSUMES = {
+    "ecommerce_development": {"website_design_development", "website_development_only", "ui_ux_design"},
+    "website_development_only": {"website_design_development"},
+    "website_design_development": {"ui_ux_design"}
+}
+
+def keyword_pattern(phrases) -> re.Pattern:
+    return re.compile(r"\b(?:" + "|".join(re.escape(phrase) for phrase in phrases) + r")s?\b")
+
+class PricingEngine:
+    """
+    Prices fixed projects without the LLM when they map onto exactly one
+    base component.
+
+    Title keyword hits count double. Components included by a larger
+    matched one (a website in an e-commerce build) are dropped; if no
+    component or more than one remains, the mapping is ambiguous and
+    price() returns None so the caller can ask the LLM.
+
+    The budget follows the rules given to the LLM: start from the
+    component's base budget, move a fraction of the way up towards a
+    higher client maximum, never go below the client minimum, and stay
+    within a client maximum that is below the base. The deadline is the
+    component's timeline.
+    """
+
+    def __init__(self, components: Dict[str, Dict[str, int]] = None, uplift_rate: float = PRICING_UPLIFT_RATE):
+        self.components = components or BASE_PROJECT_COMPONENTS
+        self.uplift_rate = uplift_rate
+        self.patterns = {
+            name: keyword_pattern(COMPONENT_KEYWORDS.get(name) or (name.replace('_', ' '),))
+            for name in self.components
+        }
+        self._lock = threading.Lock()
+
+        self.evaluated = 0
+        self.priced = 0
+        self.ambiguous = 0
+        self.total_seconds = 0.0
+
+    def match_components(self, project: Dict[str, Any]) -> List[Tuple[str, int]]:
+        """
+        Get the matched components and their keyword scores, best first.
+        """
+        title = (project.get('project_title') or '').lower()
+        description = (project.get('project_description') or '').lower()
+
+        scores = {}
+        for name, pattern in self.patterns.items():
+            score = 2 * len(pattern.findall(title)) + len(pattern.findall(description))
+            if score:
+                scores[name] = score
+
+        for name in list(scores):
+            for included in SUBSUMES.get(name, ()):
+                scores.pop(included, None)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+    def compute(self, component: str, min_budget: float, max_budget: float) -> Tuple[int, int]:
+        """
+        Get the budget (USD) and deadline (days) for a component and a
+        client budget range in USD.
+        """
+        base = self.components[component]['budget']
+        budget = float(base)
+        if max_budget and max_budget > base:
+            budget = base + (max_budget - base) * self.uplift_rate
+        elif max_budget and max_budget < base:
+            budget = max_budget
+        budget = max(budget, min_budget or 0)
+        return int(round(budget)), self.components[component]['timeline']
+
+    def price(self, project: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        """
+        Get (budget, deadline) for a fixed project, or None if the mapping is ambiguous.
+        """
+        started = time.perf_counter()
+        matches = self.match_components(project)
+        result = None
+        if len(matches) == 1:
+            rate = project.get('exchange_rate') or 1
+            result = self.compute(
+                matches[0][0],
+                (project.get('minimum_budget') or 0) * rate,
+                (project.get('maximum_budget') or 0) * rate
+            )
+
+        with self._lock:
+            self.evaluated += 1
+            if result:
+                self.priced += 1
+            else:
+                self.ambiguous += 1
+            self.total_seconds += time.perf_counter() - started
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the share of projects priced locally and the average latency.
+        """
+        with self._lock:
+            return {
+                'evaluated': self.evaluated,
+                'priced': self.priced,
+                'ambiguous': self.ambiguous,
+                'local_rate': round(self.priced / self.evaluated, 4) if self.evaluated else 0.0,
+                'avg_latency_us': round(self.total_seconds / self.evaluated * 1e6, 2) if self.evaluated else 0.0
+            }
@@ -0,0 +1,210 @@
+"""
+Shared project feed that polls once for all sessions and fans out new projects
+"""
+import threading
+from collections import deque
+from typing import List, Dict, Any, Optional
+
+from freelancersdk.resources.projects.helpers import create_get_projects_project_details_object
+
+from .config import PROJECT_SEARCH_LIMIT, PROJECT_FEED_POLL_INTERVAL, PROJECT_FEED_QUEUE_SIZE
+from .freelancer_service import FreelancerService
+from .project_poller import IncrementalProjectPoller
+
+class FeedSubscription:
+    """
+    A session's queue of projects from the shared feed.
+
+    Exposes the same poll()/reset() interface as IncrementalProjectPoller so
+    FreelancerBot can use either as its project source.
+    """
+
+    def __init__(self, session_id: str, oauth_token: str,
+                 skill_ids: List[int], language_codes: List[str],
+                 queue_size: int = PROJECT_FEED_QUEUE_SIZE):
+        self.session_id = session_id
+        self.oauth_token = oauth_token
+        self.skill_ids = set(skill_ids or [])
+        self.language_codes = set(language_codes or [])
+        self._queue: deque = deque(maxlen=queue_size)
+        self._lock = threading.Lock()
+
+    def accepts(self, project: Dict[str, Any]) -> bool:
+        """
+        Apply this session's skill and language filters to a feed project.
+        """
+        language = project.get('language')
+        if language and self.language_codes and language not in self.language_codes:
+            return False
+
+        jobs = project.get('jobs')
+        if jobs and self.skill_ids:
+            return any(job.get('id') in self.skill_ids for job in jobs if isinstance(job, dict))
+        return True
+
+    def publish(self, project: Dict[str, Any]) -> None:
+        """Queue a project for this session, dropping the oldest when full"""
+        with self._lock:
+            self._queue.append(project)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Drain queued projects, newest first.
+        """
+        with self._lock:
+            projects = list(self._queue)
+            self._queue.clear()
+        projects.reverse()
+        return projects
+
+    def reset(self) -> None:
+        """
+        Drop queued projects.
+        """
+        with self._lock:
+            self._queue.clear()
+
+class ProjectFeed:
+    """
+    Polls the union of all subscribed sessions' skill filters with a single
+    search service and publishes each new project to every matching session.
+    """
+
+    def __init__(self, poll_interval: float = PROJECT_FEED_POLL_INTERVAL,
+                 page_size: int = PROJECT_SEARCH_LIMIT):
+        self.poll_interval = poll_interval
+        self.page_size = page_size
+        self.subscriptions: Dict[str, FeedSubscription] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._service: Optional[FreelancerService] = None
+        self._poller: Optional[IncrementalProjectPoller] = None
+        self._needs_rebuild = True
+
+        self.polls = 0
+        self.projects_published = 0
+
+    def subscribe(self, session_id: str, oauth_token: str, skill_ids: List[int],
+                  language_codes: List[str]) -> FeedSubscription:
+        """
+        Subscribe a session to the feed, starting the polling thread if needed.
+        """
+        subscription = FeedSubscription(session_id, oauth_token, skill_ids, language_codes)
+        with self._lock:
+            self.subscriptions[session_id] = subscription
+            self._needs_rebuild = True
+            stopping_thread = self._thread if self._stop_event.is_set() else None
+
+        # Let a thread that was told to stop finish before starting a new one
+        if stopping_thread is not None:
+            stopping_thread.join()
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return subscription
+
+    def unsubscribe(self, session_id: str, subscription: Optional[FeedSubscription] = None) -> None:
+        """
+        Remove a session, stopping the polling thread when none are left.
+        With a subscription, it is only removed if it is still the session's
+        current one, so a stopped bot cannot remove its restarted successor's.
+        """
+        with self._lock:
+            current = self.subscriptions.get(session_id)
+            if current is None or (subscription is not None and current is not subscription):
+                return
+            del self.subscriptions[session_id]
+            self._needs_rebuild = True
+            if not self.subscriptions:
+                self._stop_event.set()
+
+    def _rebuild_service(self) -> None:
+        """Recreate the search service for the current union of filters"""
+        with self._lock:
+            subscriptions = list(self.subscriptions.values())
+            self._needs_rebuild = False
+
+        # Keep the high-water mark so a rebuild does not re-publish old projects
+        high_water_mark = self._poller.high_water_mark if self._poller else None
+        if self._service is not None:
+            self._service.close()
+            self._service = None
+            self._poller = None
+
+        if not subscriptions:
+            return
+
+        skill_ids = sorted(set().union(*(subscription.skill_ids for subscription in subscriptions)))
+        language_codes = sorted(set().union(*(subscription.language_codes for subscription in subscriptions)))
+
+        self._service = FreelancerService(
+            skill_ids=skill_ids,
+            language_codes=language_codes,
+            oauth_token=subscriptions[0].oauth_token
+        )
+        project_details = create_get_projects_project_details_object(jobs=True)
+        self._poller = IncrementalProjectPoller(
+            lambda limit, offset: self._service.search_projects(limit, offset, project_details=project_details),
+            page_size=self.page_size
+        )
+        self._poller.high_water_mark = high_water_mark
+
+    def poll_once(self) -> int:
+        """
+        Poll the feed once and publish new projects to matching sessions.
+        """
+        if self._needs_rebuild:
+            self._rebuild_service()
+        if self._poller is None:
+            return 0
+
+        projects = self._poller.poll()
+        self.polls += 1
+
+        with self._lock:
+            subscriptions = list(self.subscriptions.values())
+
+        # Publish oldest first so each session's queue stays in feed order
+        published = 0
+        for project in reversed(projects):
+            for subscription in subscriptions:
+                if subscription.accepts(project):
+                    subscription.publish(project)
+                    published += 1
+
+        self.projects_published += published
+        return published
+
+    def _run(self) -> None:
+        """Polling thread body"""
+        while not self._stop_event.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"Error polling shared project feed: {e}")
+            self._stop_event.wait(self.poll_interval)
+
+        if self._service is not None:
+            self._service.close()
+            self._service = None
+            self._poller = None
+        self._needs_rebuild = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get feed counters.
+        """
+        return {
+            'subscribers': len(self.subscriptions),
+            'polls': self.polls,
+            'search_requests': self._poller.requests_made if self._poller else 0,
+            'projects_published': self.projects_published
+        }
+
+# Global project feed shared by every session
+project_feed = ProjectFeed()
@@ -0,0 +1,79 @@
+"""
+Incremental project polling against a time_updated high-water mark
+"""
+from typing import Callable, List, Dict, Any, Optional, Tuple
+
+from .config import PROJECT_SEARCH_LIMIT, PROJECT_POLL_MAX_PAGES
+from .utils import logger
+
+def project_cursor(project: Dict[str, Any]) -> Tuple[float, int]:
+    """
+    Get the (timestamp, id) sort key of a search result.
+    """
+    timestamp = project.get('time_updated') or project.get('submitdate') or 0
+    return float(timestamp), int(project.get('id') or 0)
+
+class IncrementalProjectPoller:
+    """
+    Pages through search results (newest first) only until it reaches a
+    project at or below the high-water mark of the previous poll.
+    """
+
+    def __init__(self, fetch_page: Callable[[int, int], List[Dict[str, Any]]],
+                 page_size: int = PROJECT_SEARCH_LIMIT, max_pages: int = PROJECT_POLL_MAX_PAGES):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.max_pages = max(1, max_pages)
+        self.high_water_mark: Optional[Tuple[float, int]] = None
+        self.requests_made = 0
+        # Polls that hit max_pages before reaching seen projects, skipping the rest of the burst
+        self.gaps = 0
+        self.last_poll_had_gap = False
+
+    def reset(self) -> None:
+        """
+        Forget the high-water mark so the next poll starts from the first page.
+        """
+        self.high_water_mark = None
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Get projects newer than the high-water mark, newest first. Each
+        project is returned once, even if a project posted mid-poll pushed
+        it onto the next page too.
+        """
+        new_projects = []
+        seen_ids = set()
+        newest = self.high_water_mark
+        self.last_poll_had_gap = False
+
+        for page in range(self.max_pages):
+            projects = self.fetch_page(self.page_size, page * self.page_size)
+            self.requests_made += 1
+
+            reached_seen = False
+            for project in projects:
+                cursor = project_cursor(project)
+                if self.high_water_mark is not None and cursor <= self.high_water_mark:
+                    reached_seen = True
+                    break
+                if project.get('id') in seen_ids:
+                    continue
+                seen_ids.add(project.get('id'))
+                new_projects.append(project)
+                if newest is None or cursor > newest:
+                    newest = cursor
+
+            # The first poll only takes one page, later polls stop at seen projects
+            if reached_seen or self.high_water_mark is None or len(projects) < self.page_size:
+                break
+        else:
+            self.gaps += 1
+            self.last_poll_had_gap = True
+            logger.warning(
+                f"Project poll stopped after {self.max_pages} pages without reaching seen projects; "
+                f"older projects from this burst were skipped (raise PROJECT_POLL_MAX_PAGES to cover it)"
+            )
+
+        self.high_water_mark = newest
+        return new_projects
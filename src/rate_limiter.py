@@ -0,0 +1,120 @@
+"""
+Per-OAuth-token rate limiting for Freelancer API calls
+"""
+import time
+import asyncio
+import threading
+from typing import Dict, Any, Optional
+
+from .config import (
+    FREELANCER_RATE_LIMIT_PER_SECOND, FREELANCER_RATE_LIMIT_BURST, FREELANCER_RATE_LIMIT_BID_RESERVE
+)
+
+# Call priorities, lower is more urgent
+PRIORITY_BID = 0
+PRIORITY_NORMAL = 1
+
+class TokenBucketLimiter:
+    """
+    Token bucket shared by every service using the same OAuth token.
+
+    The last `reserve` tokens can only be taken by bid placement, so search
+    and enrichment calls back off first when the budget runs low. A 429
+    response pauses all callers until its Retry-After has passed.
+
+    State is guarded by a thread lock because services using the same token
+    run on different event loops.
+    """
+
+    def __init__(self, rate_per_second: float = FREELANCER_RATE_LIMIT_PER_SECOND,
+                 burst: int = FREELANCER_RATE_LIMIT_BURST,
+                 reserve: int = FREELANCER_RATE_LIMIT_BID_RESERVE):
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.reserve = min(max(0, reserve), self.burst - 1)
+        self.tokens = float(self.burst)
+        self.paused_until = 0.0
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+        self.rate_limited_responses = 0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last update"""
+        self.tokens = min(self.burst, self.tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+    def _try_acquire(self, priority: int) -> float:
+        """Take a token, or return how long to wait before trying again"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if now < self.paused_until:
+                return self.paused_until - now
+
+            floor = 0 if priority == PRIORITY_BID else self.reserve
+            if self.tokens - 1 >= floor:
+                self.tokens -= 1
+                self.acquired += 1
+                return 0.0
+
+            return (floor + 1 - self.tokens) / self.rate_per_second
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> None:
+        """
+        Wait until a call with the given priority may be made.
+        """
+        throttled = False
+        while True:
+            wait = self._try_acquire(priority)
+            if wait <= 0:
+                return
+
+            if not throttled:
+                throttled = True
+                with self._lock:
+                    self.throttled += 1
+            with self._lock:
+                self.waited_seconds += wait
+            await asyncio.sleep(wait)
+
+    def penalize(self, retry_after: float) -> None:
+        """
+        Pause all callers after a 429 response and drain the bucket.
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            self.tokens = 0.0
+            self.rate_limited_responses += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter counters.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'tokens': round(self.tokens, 2),
+                'acquired': self.acquired,
+                'throttled': self.throttled,
+                'waited_seconds': round(self.waited_seconds, 2),
+                'rate_limited_responses': self.rate_limited_responses
+            }
+
+_limiters: Dict[str, TokenBucketLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(oauth_token: Optional[str]) -> TokenBucketLimiter:
+    """
+    Get the limiter shared by all calls made with an OAuth token.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(oauth_token or '')
+        if limiter is None:
+            limiter = TokenBucketLimiter()
+            _limiters[oauth_token or ''] = limiter
+        return limiter
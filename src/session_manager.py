@@ -11,6 +11,8 @@ from dataclasses import dataclass, asdict
 from .bot import FreelancerBot
 from .config_manager import ConfigManager
 from .database import DatabaseService
+from .project_feed import project_feed
+from .config import SHARED_PROJECT_FEED
 
 @dataclass
 class UserSession:
@@ -30,6 +32,9 @@ class UserSession:
     language_codes: List[str] = None
     unwanted_currencies: List[str] = None
     unwanted_countries: List[str] = None
+    match_model: str = ''  # Per-stage models, empty for the GROQ_*_MODEL defaults
+    budget_model: str = ''
+    bid_model: str = ''
     created_at: datetime = None
     is_active: bool = False
     
@@ -137,7 +142,10 @@ class SessionManager:
             
             # Start bot in a separate thread
             def run_bot():
-                bot.start(session.bid_limit)
+                try:
+                    bot.start(session.bid_limit)
+                finally:
+                    project_feed.unsubscribe(session_id, bot.project_poller)
             
             thread = threading.Thread(target=run_bot, daemon=True)
             thread.start()
@@ -168,6 +176,7 @@ class SessionManager:
         try:
             bot = self.bot_instances[session_id]
             result = bot.stop()
+            project_feed.unsubscribe(session_id, bot.project_poller)
             
             # Mark session as inactive
             session.is_active = False
@@ -238,25 +247,40 @@ class SessionManager:
             signature=session.signature
         )
         
-        # Create bot instance with session-specific parameters
-        bot = FreelancerBot(
-            session_id=session.session_id,
-            bid_limit=session.bid_limit,
-            project_search_limit=session.project_search_limit,
-            min_wait_time=session.min_wait_time,
-            skill_ids=session.skill_ids,
-            language_codes=session.language_codes,
-            unwanted_currencies=session.unwanted_currencies,
-            unwanted_countries=session.unwanted_countries,
-            config_manager_instance=session_config
+        session_config.update_model_config(
+            match_model=session.match_model,
+            budget_model=session.budget_model,
+            bid_model=session.bid_model
         )
         
-        # Override the global config manager for this bot instance
-        bot.freelancer_service.config_manager = session_config
+        # Receive projects from the shared feed instead of polling per session
+        project_poller = None
+        if SHARED_PROJECT_FEED:
+            project_poller = project_feed.subscribe(
+                session.session_id,
+                session.oauth_token,
+                session.skill_ids,
+                session.language_codes
+            )
         
-        # Update the FreelancerService session with the session-specific OAuth token
-        from freelancersdk.session import Session
-        bot.freelancer_service.session = Session(oauth_token=session.oauth_token)
+        # Create bot instance with session-specific parameters
+        try:
+            bot = FreelancerBot(
+                session_id=session.session_id,
+                bid_limit=session.bid_limit,
+                project_search_limit=session.project_search_limit,
+                min_wait_time=session.min_wait_time,
+                skill_ids=session.skill_ids,
+                language_codes=session.language_codes,
+                unwanted_currencies=session.unwanted_currencies,
+                unwanted_countries=session.unwanted_countries,
+                config_manager_instance=session_config,
+                project_poller=project_poller
+            )
+        except Exception:
+            if project_poller is not None:
+                project_feed.unsubscribe(session.session_id, project_poller)
+            raise
         
         return bot
     
@@ -3,8 +3,9 @@ Utility functions for the Freelancer Bot
 """
 import time
 import re
+import json
 import logging
-from typing import Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from functools import wraps
 
 # Configure logging
@@ -82,6 +83,73 @@ def clean_llm_response(response: str) -> str:
     cleaned = re.sub(r'<think>.*?</think>', '', response, flags=re.DOTALL)
     return cleaned.strip()
 
+def parse_project_analysis(response: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse and validate a combined analysis JSON response.
+    Returns None if the response does not match the expected schema.
+    """
+    cleaned = clean_llm_response(response)
+    match = re.search(r"\{.*\}", cleaned, flags=re.DOTALL)
+    if not match:
+        logger.error("No JSON object in combined analysis response.")
+        return None
+
+    try:
+        data = json.loads(match.group(0))
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in combined analysis response: {e}")
+        return None
+
+    if not isinstance(data, dict):
+        return None
+
+    verdict = str(data.get('verdict', '')).strip().upper()
+    if verdict not in ('MATCH', 'NO MATCH'):
+        logger.error(f"Invalid verdict in combined analysis response: {data.get('verdict')}")
+        return None
+
+    analysis = {'verdict': verdict, 'budget': None, 'deadline': None, 'bid_content': ''}
+    if verdict == 'NO MATCH':
+        return analysis
+
+    for field in ('budget', 'deadline'):
+        value = data.get(field)
+        if value is None:
+            continue
+        try:
+            value = int(float(value))
+        except (TypeError, ValueError):
+            logger.error(f"Invalid {field} in combined analysis response: {value}")
+            return None
+        if value <= 0:
+            logger.error(f"Invalid {field} in combined analysis response: {value}")
+            return None
+        analysis[field] = value
+
+    bid_content = data.get('bid_content')
+    if not isinstance(bid_content, str) or not bid_content.strip():
+        logger.error("Missing bid_content in combined analysis response.")
+        return None
+    analysis['bid_content'] = bid_content.strip()
+
+    return analysis
+
+def parse_batch_verdicts(response: str, count: int) -> List[Optional[str]]:
+    """
+    Parse '<number>: MATCH' / '<number>: NO MATCH' lines from a batched
+    match check. Projects without exactly one verdict get None.
+    """
+    verdicts: Dict[int, set] = {}
+    for line in clean_llm_response(response).splitlines():
+        match = re.match(r"\s*(?:project\s*)?#?(\d+)\s*[:.)\-]\s*\**\s*(NO MATCH|MATCH)\b", line, flags=re.IGNORECASE)
+        if match and 1 <= int(match.group(1)) <= count:
+            verdicts.setdefault(int(match.group(1)), set()).add(match.group(2).upper())
+
+    return [
+        next(iter(verdicts[number])) if len(verdicts.get(number, ())) == 1 else None
+        for number in range(1, count + 1)
+    ]
+
 def format_currency(amount: float, currency: str) -> str:
     """
     Format currency amount for display.
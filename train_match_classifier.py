@@ -0,0 +1,17 @@
+"""
+Export match verdict history and train the local match classifier
+
+    python train_match_classifier.py export --session <session_id> --output verdicts.jsonl
+    python train_match_classifier.py train --session <session_id>
+"""
+import sys
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(src_path))
+
+from src.match_classifier import main
+
+if __name__ == "__main__":
+    main()